@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Iterable, Iterator, Optional
-import io
+import functools
+import re
+import sys
 import zipfile
 
 from .parser import Airspace, AirspaceShape, Airport, Navaid, Runway, RunwayEnd, Waypoint
@@ -22,45 +24,38 @@ def read_cycle(path: Path) -> Optional[str]:
 def iter_airports(path: Path) -> Iterator[Airport]:
     """Yield airports from an ARINC 424 dataset."""
 
-    airports: list[Airport] = []
     codes: set[str] = set()
-    for line in _iter_lines(path):
-        if not _is_section(line, "PA"):
-            continue
-        if line[21] != "0":
+    runway_coords: dict[str, list[float]] = {}
+    for line in _iter_airport_section(path, b"PA"):
+        if line[21:22] != b"0":
             continue
         icao = _strip(line[6:10])
         if not icao:
             continue
         codes.add(icao)
-        ofmx_id = _airport_id(icao)
-        code_id = icao
-        airports.append(
-            Airport(
-                ofmx_id=ofmx_id,
-                region=_strip(line[10:12]),
-                code_id=code_id,
-                code_icao=icao,
-                code_gps=None,
-                code_type=None,
-                name=_strip(line[93:123]),
-                city=None,
-                elevation=_to_int(line[56:61]),
-                elevation_uom="FT" if _strip(line[56:61]) else None,
-                mag_var=_parse_mag_var(line[51:56]),
-                mag_var_year=None,
-                transition_alt=_to_int(line[70:75]),
-                transition_alt_uom="FT" if _strip(line[70:75]) else None,
-                remarks=None,
-                latitude=_parse_lat(line[32:41]),
-                longitude=_parse_lon(line[41:51]),
-            )
+        elevation, elevation_uom = _int_with_uom(line[56:61], "FT")
+        transition_alt, transition_alt_uom = _int_with_uom(line[70:75], "FT")
+        yield Airport(
+            ofmx_id=_airport_id(icao),
+            region=_intern_strip(line[10:12]),
+            code_id=icao,
+            code_icao=icao,
+            code_gps=None,
+            code_type=None,
+            name=_strip(line[93:123]),
+            city=None,
+            elevation=elevation,
+            elevation_uom=elevation_uom,
+            mag_var=_parse_mag_var(line[51:56]),
+            mag_var_year=None,
+            transition_alt=transition_alt,
+            transition_alt_uom=transition_alt_uom,
+            remarks=None,
+            latitude=_parse_lat(line[32:41]),
+            longitude=_parse_lon(line[41:51]),
         )
-    runway_coords: dict[str, list[tuple[float, float]]] = {}
-    for line in _iter_lines(path):
-        if not _is_section(line, "PG"):
-            continue
-        if line[21] != "0":
+    for line in _iter_airport_section(path, b"PG"):
+        if line[21:22] != b"0":
             continue
         icao = _strip(line[6:10])
         if not icao or icao in codes:
@@ -68,65 +63,69 @@ def iter_airports(path: Path) -> Iterator[Airport]:
         lat = _parse_lat(line[32:41])
         lon = _parse_lon(line[41:51])
         if lat is not None and lon is not None:
-            runway_coords.setdefault(icao, []).append((lat, lon))
-    for icao, coords in runway_coords.items():
+            sums = runway_coords.setdefault(icao, [0.0, 0.0, 0.0])
+            sums[0] += lat
+            sums[1] += lon
+            sums[2] += 1.0
+    for icao, (lat_sum, lon_sum, count) in runway_coords.items():
         if icao in codes:
             continue
         codes.add(icao)
-        if coords:
-            lat = sum(point[0] for point in coords) / len(coords)
-            lon = sum(point[1] for point in coords) / len(coords)
-        else:
-            lat = None
-            lon = None
-        airports.append(
-            Airport(
-                ofmx_id=_airport_id(icao),
-                region=None,
-                code_id=icao,
-                code_icao=icao,
-                code_gps=None,
-                code_type=None,
-                name=None,
-                city=None,
-                elevation=None,
-                elevation_uom=None,
-                mag_var=None,
-                mag_var_year=None,
-                transition_alt=None,
-                transition_alt_uom=None,
-                remarks=None,
-                latitude=lat,
-                longitude=lon,
-            )
+        yield Airport(
+            ofmx_id=_airport_id(icao),
+            region=None,
+            code_id=icao,
+            code_icao=icao,
+            code_gps=None,
+            code_type=None,
+            name=None,
+            city=None,
+            elevation=None,
+            elevation_uom=None,
+            mag_var=None,
+            mag_var_year=None,
+            transition_alt=None,
+            transition_alt_uom=None,
+            remarks=None,
+            latitude=lat_sum / count,
+            longitude=lon_sum / count,
         )
-    yield from airports
 
 
 def iter_runways(path: Path) -> Iterator[Runway]:
     """Yield runways from an ARINC 424 dataset."""
 
-    runways: dict[str, Runway] = {}
+    pending: dict[str, dict] = {}
     for data in _iter_runway_end_data(path):
-        runway = runways.get(data.runway_ofmx_id)
-        if runway is None:
-            runways[data.runway_ofmx_id] = Runway(
-                ofmx_id=data.runway_ofmx_id,
-                airport_ofmx_id=data.airport_ofmx_id,
-                designator=data.pair_designator,
-                length=data.length,
-                width=data.width,
-                uom_dim_rwy="FT" if data.length or data.width else None,
-                surface=None,
-                preparation=None,
-                pcn_note=None,
-                strip_length=None,
-                strip_width=None,
-                uom_dim_strip=None,
-            )
+        entry = pending.get(data.runway_ofmx_id)
+        if entry is None:
+            pending[data.runway_ofmx_id] = {
+                "airport_ofmx_id": data.airport_ofmx_id,
+                "designator": data.pair_designator,
+                "length": data.length or 0,
+                "width": data.width or 0,
+                "uom_dim_rwy": "FT" if data.length or data.width else None,
+            }
         else:
-            runways[data.runway_ofmx_id] = _merge_runways(runway, data)
-    yield from runways.values()
+            if data.length and data.length > entry["length"]:
+                entry["length"] = data.length
+            if data.width and data.width > entry["width"]:
+                entry["width"] = data.width
+    for ofmx_id, entry in pending.items():
+        yield Runway(
+            ofmx_id=ofmx_id,
+            airport_ofmx_id=entry["airport_ofmx_id"],
+            designator=entry["designator"],
+            length=entry["length"] or None,
+            width=entry["width"] or None,
+            uom_dim_rwy=entry["uom_dim_rwy"],
+            surface=None,
+            preparation=None,
+            pcn_note=None,
+            strip_length=None,
+            strip_width=None,
+            uom_dim_strip=None,
+        )
 
 
 def iter_runway_ends(path: Path) -> Iterator[RunwayEnd]:
@@ -149,66 +148,89 @@ def iter_airspaces(path: Path) -> Iterator[Airspace]:
     """Yield airspaces from an ARINC 424 dataset."""
 
     seen: set[str] = set()
-    for line in _iter_lines(path):
-        section = line[4:6]
-        if section == "UC":
-            airspace = _parse_controlled_airspace(line)
-        elif section == "UR":
-            airspace = _parse_restrictive_airspace(line)
-        elif section == "UF":
-            airspace = _parse_fir_uir(line)
-        else:
-            continue
-        if airspace is None:
-            continue
-        if airspace.ofmx_id in seen:
-            continue
-        seen.add(airspace.ofmx_id)
-        yield airspace
+    for section, parse in _AIRSPACE_PARSERS.items():
+        for line in _iter_section(path, section):
+            airspace = parse(line)
+            if airspace is None:
+                continue
+            if airspace.ofmx_id in seen:
+                continue
+            seen.add(airspace.ofmx_id)
+            yield airspace
 
 
 def iter_navaids(path: Path) -> Iterator[Navaid]:
     """Yield VHF and NDB navaids from an ARINC 424 dataset."""
 
-    for line in _iter_lines(path):
-        section = line[4:6]
-        if section == "D ":
-            yield _parse_vhf_navaid(line)
-        elif section == "DB":
-            yield _parse_ndb_navaid(line)
+    for section, parse in _NAVAID_PARSERS.items():
+        for line in _iter_section(path, section):
+            yield parse(line)
 
 
 def iter_waypoints(path: Path) -> Iterator[Waypoint]:
     """Yield waypoints from an ARINC 424 dataset."""
 
-    for line in _iter_lines(path):
-        section = line[4:6]
-        if section not in {"EA", "PC"}:
-            continue
-        if line[21] != "0":
-            continue
-        ident = _strip(line[13:18])
-        if not ident:
-            continue
-        ofmx_id = _waypoint_id(section, ident, line[6:10])
-        yield Waypoint(
-            ofmx_id=ofmx_id,
-            region=_strip(line[6:10]),
-            code_id=ident,
-            name=_strip(line[98:123]) or ident,
-            point_type=_strip(line[26:29]),
-            latitude=_parse_lat(line[32:41]),
-            longitude=_parse_lon(line[41:51]),
-        )
+    for label, section in (("EA", b"EA"), ("PC", b"PC")):
+        for line in _iter_section(path, section):
+            if line[21:22] != b"0":
+                continue
+            ident = _strip(line[13:18])
+            if not ident:
+                continue
+            region = line[6:10].decode("ascii", "ignore")
+            yield Waypoint(
+                ofmx_id=_waypoint_id(label, ident, region),
+                region=_intern_strip(line[6:10]),
+                code_id=ident,
+                name=_strip(line[98:123]) or ident,
+                point_type=_intern_strip(line[26:29]),
+                latitude=_parse_lat(line[32:41]),
+                longitude=_parse_lon(line[41:51]),
+            )
+
+
+def iter_all(path: Path) -> Iterator[tuple[str, object]]:
+    """Yield ``(kind, record)`` pairs for every entity in the dataset.
+
+    The section index is built once and cached, so the per-kind iterators
+    replay cached lines rather than re-reading the file.
+    """
+
+    for kind, iterate in (
+        ("airport", iter_airports),
+        ("runway", iter_runways),
+        ("runway_end", iter_runway_ends),
+        ("airspace", iter_airspaces),
+        ("navaid", iter_navaids),
+        ("waypoint", iter_waypoints),
+    ):
+        for record in iterate(path):
+            yield kind, record
+
+
+_EMPTY_SHAPES: tuple[AirspaceShape, ...] = ()
 
 
 def iter_airspace_shapes(_: Path) -> Iterator[AirspaceShape]:
     """ARINC 424 datasets do not provide OFMX airspace shape extensions."""
 
-    return iter(())
+    return iter(_EMPTY_SHAPES)
 
 
 class _RunwayEndData:
+    __slots__ = (
+        "runway_end_id",
+        "runway_ofmx_id",
+        "airport_ofmx_id",
+        "designator",
+        "pair_designator",
+        "length",
+        "width",
+        "mag_bearing",
+        "latitude",
+        "longitude",
+    )
+
     def __init__(
         self,
         *,
@@ -236,10 +258,8 @@ class _RunwayEndData:
 
 
 def _iter_runway_end_data(path: Path) -> Iterator[_RunwayEndData]:
-    for line in _iter_lines(path):
-        if not _is_section(line, "PG"):
-            continue
-        if line[21] != "0":
+    for line in _iter_airport_section(path, b"PG"):
+        if line[21:22] != b"0":
             continue
         airport = _strip(line[6:10])
         if not airport:
@@ -264,28 +284,11 @@ def _iter_runway_end_data(path: Path) -> Iterator[_RunwayEndData]:
         )
 
 
-def _merge_runways(runway: Runway, data: _RunwayEndData) -> Runway:
-    return Runway(
-        ofmx_id=runway.ofmx_id,
-        airport_ofmx_id=runway.airport_ofmx_id,
-        designator=runway.designator,
-        length=max(_as_int(runway.length), _as_int(data.length)) or None,
-        width=max(_as_int(runway.width), _as_int(data.width)) or None,
-        uom_dim_rwy=runway.uom_dim_rwy,
-        surface=runway.surface,
-        preparation=runway.preparation,
-        pcn_note=runway.pcn_note,
-        strip_length=runway.strip_length,
-        strip_width=runway.strip_width,
-        uom_dim_strip=runway.uom_dim_strip,
-    )
-
-
-def _parse_controlled_airspace(line: str) -> Optional[Airspace]:
-    if line[24] != "0":
+def _parse_controlled_airspace(line: bytes) -> Optional[Airspace]:
+    if line[24:25] != b"0":
         return None
-    icao = _strip(line[6:8])
-    airspace_type = _strip(line[9])
+    icao = _intern_strip(line[6:8])
+    airspace_type = _intern_strip(line[9:10])
     airspace_center = _strip(line[9:14])
     name = _strip(line[93:123])
     lower_ref, lower_value = _parse_limit(line[81:86])
@@ -297,22 +300,22 @@ def _parse_controlled_airspace(line: str) -> Optional[Airspace]:
         code_type=airspace_type,
         name=name,
         name_alt=None,
-        airspace_class=_strip(line[16]),
+        airspace_class=_intern_strip(line[16:17]),
         upper_ref=upper_ref,
         upper_value=upper_value,
-        upper_uom=_strip(line[92]),
+        upper_uom=_strip(line[92:93]),
         lower_ref=lower_ref,
         lower_value=lower_value,
-        lower_uom=_strip(line[86]),
+        lower_uom=_strip(line[86:87]),
         remarks=None,
     )
 
 
-def _parse_restrictive_airspace(line: str) -> Optional[Airspace]:
-    if line[24] != "0":
+def _parse_restrictive_airspace(line: bytes) -> Optional[Airspace]:
+    if line[24:25] != b"0":
         return None
-    icao = _strip(line[6:8])
-    restrictive_type = _strip(line[8])
+    icao = _intern_strip(line[6:8])
+    restrictive_type = _intern_strip(line[8:9])
     designation = _strip(line[9:19])
     name = _strip(line[93:123])
     lower_ref, lower_value = _parse_limit(line[82:86])
@@ -327,16 +330,16 @@ def _parse_restrictive_airspace(line: str) -> Optional[Airspace]:
         airspace_class=None,
         upper_ref=upper_ref,
         upper_value=upper_value,
-        upper_uom=_strip(line[92]),
+        upper_uom=_strip(line[92:93]),
         lower_ref=lower_ref,
         lower_value=lower_value,
-        lower_uom=_strip(line[86]),
+        lower_uom=_strip(line[86:87]),
         remarks=None,
     )
 
 
-def _parse_fir_uir(line: str) -> Optional[Airspace]:
-    if line[19] != "0":
+def _parse_fir_uir(line: bytes) -> Optional[Airspace]:
+    if line[19:20] != b"0":
         return None
     ident = _strip(line[6:10])
     name = _strip(line[98:123])
@@ -346,9 +349,9 @@ def _parse_fir_uir(line: str) -> Optional[Airspace]:
         lower_ref, lower_value = _parse_limit(line[80:85])
     return Airspace(
         ofmx_id=f"ARINC:UF:{ident}",
-        region=_strip(line[1:4]),
+        region=_intern_strip(line[1:4]),
         code_id=ident,
-        code_type=_strip(line[14]),
+        code_type=_intern_strip(line[14:15]),
         name=name,
         name_alt=None,
         airspace_class=None,
@@ -362,9 +365,11 @@ def _parse_fir_uir(line: str) -> Optional[Airspace]:
     )
 
 
-def _parse_vhf_navaid(line: str) -> Navaid:
+def _parse_vhf_navaid(line: bytes) -> Navaid:
     ident = _strip(line[13:17]) or ""
-    icao = _strip(line[10:12])
+    icao = _intern_strip(line[10:12])
+    frequency, frequency_uom = _freq_with_uom(line[22:27], "MHz")
+    elevation, elevation_uom = _int_with_uom(line[79:84], "FT")
     return Navaid(
         ofmx_id=f"ARINC:D:{icao}:{ident}",
         region=icao,
@@ -372,23 +377,24 @@ def _parse_vhf_navaid(line: str) -> Navaid:
         name=_strip(line[93:123]),
         navaid_type="VOR",
         code_type=None,
-        frequency=_parse_frequency(line[22:27]),
-        frequency_uom="MHz" if _strip(line[22:27]) else None,
+        frequency=frequency,
+        frequency_uom=frequency_uom,
         channel=None,
         ghost_frequency=None,
-        elevation=_to_int(line[79:84]),
-        elevation_uom="FT" if _strip(line[79:84]) else None,
+        elevation=elevation,
+        elevation_uom=elevation_uom,
         mag_var=_parse_mag_var(line[74:79]),
-        datum=_strip(line[90:93]),
+        datum=_intern_strip(line[90:93]),
         associated_vor_ofmx_id=None,
         latitude=_parse_lat(line[32:41]),
         longitude=_parse_lon(line[41:51]),
     )
 
 
-def _parse_ndb_navaid(line: str) -> Navaid:
+def _parse_ndb_navaid(line: bytes) -> Navaid:
     ident = _strip(line[13:17]) or ""
-    icao = _strip(line[10:12])
+    icao = _intern_strip(line[10:12])
+    frequency, frequency_uom = _freq_with_uom(line[22:27], "kHz")
     return Navaid(
         ofmx_id=f"ARINC:DB:{icao}:{ident}",
         region=icao,
@@ -396,210 +402,277 @@ def _parse_ndb_navaid(line: str) -> Navaid:
         name=_strip(line[93:123]),
         navaid_type="NDB",
         code_type=None,
-        frequency=_parse_frequency(line[22:27]),
-        frequency_uom="kHz" if _strip(line[22:27]) else None,
+        frequency=frequency,
+        frequency_uom=frequency_uom,
         channel=None,
         ghost_frequency=None,
         elevation=None,
         elevation_uom=None,
         mag_var=_parse_mag_var(line[74:79]),
-        datum=_strip(line[90:93]),
+        datum=_intern_strip(line[90:93]),
         associated_vor_ofmx_id=None,
         latitude=_parse_lat(line[32:41]),
         longitude=_parse_lon(line[41:51]),
     )
 
 
-def _iter_lines(path: Path) -> Iterator[str]:
+_AIRSPACE_PARSERS = {
+    b"UC": _parse_controlled_airspace,
+    b"UR": _parse_restrictive_airspace,
+    b"UF": _parse_fir_uir,
+}
+
+_NAVAID_PARSERS = {
+    b"D ": _parse_vhf_navaid,
+    b"DB": _parse_ndb_navaid,
+}
+
+
+def _iter_lines(path: Path) -> Iterator[bytes]:
+    return iter(_load_lines(str(path), path.stat().st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_lines(path_str: str, _mtime_ns: int) -> tuple[bytes, ...]:
+    """Read a dataset once and share the lines across iterator passes.
+
+    Lines stay as bytes: the fixed-width parsers only compare and slice
+    ASCII ranges, so only the handful of surfaced fields get decoded.
+    """
+
+    path = Path(path_str)
     if path.suffix.lower() == ".zip":
-        yield from _iter_zip_lines(path)
-        return
-    with path.open("r", encoding="ascii", errors="ignore") as handle:
-        for line in handle:
-            line = line.rstrip("\r\n")
-            if not line:
-                continue
-            yield line
+        return tuple(_iter_zip_lines(path))
+    return tuple(line for line in path.read_bytes().splitlines() if line)
+
+
+def _iter_section(path: Path, section: bytes) -> Iterator[bytes]:
+    """Iterate lines whose columns 5-6 carry the given section code."""
+
+    raw, _ = _load_sections(str(path), path.stat().st_mtime_ns)
+    return iter(raw.get(section, ()))
+
+
+def _iter_airport_section(path: Path, section: bytes) -> Iterator[bytes]:
+    """Iterate airport (P) lines whose column 13 subsection matches."""
+
+    _, sub = _load_sections(str(path), path.stat().st_mtime_ns)
+    return iter(sub.get(section, ()))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sections(
+    path_str: str, _mtime_ns: int
+) -> tuple[dict[bytes, tuple[bytes, ...]], dict[bytes, tuple[bytes, ...]]]:
+    """Group the cached lines by section code in a single classification pass.
+
+    Returns two indexes because ARINC keeps the subsection in columns 5-6
+    for most records but in column 13 for airport (P) records.
+    """
+
+    raw: dict[bytes, list[bytes]] = {}
+    sub: dict[bytes, list[bytes]] = {}
+    for line in _load_lines(path_str, _mtime_ns):
+        if len(line) < 6:
+            continue
+        raw.setdefault(line[4:6], []).append(line)
+        if line[4:5] == b"P" and len(line) > 12:
+            sub.setdefault(b"P" + line[12:13], []).append(line)
+    return (
+        {key: tuple(lines) for key, lines in raw.items()},
+        {key: tuple(lines) for key, lines in sub.items()},
+    )
 
 
-def _iter_zip_lines(path: Path) -> Iterator[str]:
+def _iter_zip_lines(path: Path) -> Iterator[bytes]:
     with zipfile.ZipFile(path) as archive:
         members = [name for name in archive.namelist() if name.endswith(".pc")]
         if not members:
             return
         preferred = [name for name in members if "/isolated/" in name]
         target = preferred[0] if preferred else members[0]
-        with archive.open(target) as handle:
-            wrapper = io.TextIOWrapper(handle, encoding="ascii", errors="ignore")
-            for line in wrapper:
-                line = line.rstrip("\r\n")
-                if not line:
-                    continue
-                yield line
-
-
-def _is_section(line: str, section: str) -> bool:
-    if line[4] == "P":
-        return line[4] + line[12] == section
-    return line[4:6] == section
+        data = archive.read(target)
+    for line in data.splitlines():
+        if not line:
+            continue
+        yield line
 
 
+@functools.lru_cache(maxsize=8192)
 def _airport_id(icao: str) -> str:
     return f"ARINC:PA:{icao}"
 
 
+@functools.lru_cache(maxsize=8192)
 def _runway_id(airport: str, pair_key: str) -> str:
     return f"ARINC:PG:{airport}:{pair_key}"
 
 
+@functools.lru_cache(maxsize=8192)
 def _runway_end_id(airport: str, designator: str) -> str:
     return f"ARINC:RD:{airport}:{designator}"
 
 
+@functools.lru_cache(maxsize=8192)
 def _waypoint_id(section: str, ident: str, region: str | None) -> str:
     region_part = region or ""
     return f"ARINC:{section}:{region_part}:{ident}"
 
 
+_RUNWAY_DESIG_RE = re.compile(r"(?:RW)?\s*(\d+)\s*([A-Za-z]?)\s*", re.IGNORECASE)
+
+
 def _normalize_runway_designator(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
-    raw = value.strip()
-    if raw.upper().startswith("RW"):
-        raw = raw[2:]
-    raw = raw.strip()
-    if not raw:
-        return None
-    digits = "".join(ch for ch in raw if ch.isdigit())
-    side = "".join(ch for ch in raw if ch.isalpha()).upper()
-    if not digits:
+    match = _RUNWAY_DESIG_RE.fullmatch(value.strip())
+    if match is None:
         return None
-    number = int(digits)
-    side = side[:1] if side else ""
-    return f"{number:02d}{side}"
+    return f"{int(match.group(1)):02d}{match.group(2).upper()}"
+
 
+_RECIPROCAL_SIDE = {"L": "R", "R": "L", "C": "C", "": ""}
 
+
+@functools.lru_cache(maxsize=256)
 def _runway_pair(designator: str) -> tuple[str, str]:
     num = int(designator[:2])
     side = designator[2:] if len(designator) > 2 else ""
     reciprocal = (num + 18) % 36
     reciprocal = 36 if reciprocal == 0 else reciprocal
-    reciprocal_side = {"L": "R", "R": "L", "C": "C", "": ""}.get(side, "")
+    reciprocal_side = _RECIPROCAL_SIDE.get(side, "")
     other = f"{reciprocal:02d}{reciprocal_side}"
-    first, second = sorted([designator, other], key=_runway_sort_key)
-    pair_key = f"{first}-{second}"
-    pair_designator = f"{first}/{second}"
-    return pair_key, pair_designator
+    if (num, side) <= (reciprocal, reciprocal_side):
+        first, second = designator, other
+    else:
+        first, second = other, designator
+    return f"{first}-{second}", f"{first}/{second}"
 
 
-def _runway_sort_key(designator: str) -> tuple[int, str]:
-    number = int(designator[:2])
-    side = designator[2:] if len(designator) > 2 else ""
-    return number, side
+def _strip(value: bytes) -> Optional[str]:
+    stripped = value.strip()
+    if not stripped:
+        return None
+    return stripped.decode("ascii", "ignore")
+
 
+def _intern_strip(value: bytes) -> Optional[str]:
+    """Like `_strip` but interns the result for low-cardinality columns."""
 
-def _strip(value: str) -> Optional[str]:
     stripped = value.strip()
-    return stripped or None
+    if not stripped:
+        return None
+    return sys.intern(stripped.decode("ascii", "ignore"))
 
 
-def _to_int(value: str) -> Optional[int]:
-    value = value.strip()
+def _int_with_uom(raw: bytes, uom: str) -> tuple[Optional[int], Optional[str]]:
+    """Parse a numeric field and its unit label from one strip of the slice."""
+
+    value = raw.strip()
     if not value:
-        return None
+        return None, None
     try:
-        return int(value)
+        return int(value), uom
     except ValueError:
-        return None
+        return None, uom
 
 
-def _as_int(value: Optional[int]) -> int:
-    return value or 0
+def _freq_with_uom(raw: bytes, uom: str) -> tuple[Optional[float], Optional[str]]:
+    value = raw.strip()
+    if not value:
+        return None, None
+    try:
+        return int(value) / 100.0, uom
+    except ValueError:
+        return None, uom
 
 
-def _parse_frequency(value: str) -> Optional[float]:
+def _to_int(value: bytes) -> Optional[int]:
     value = value.strip()
     if not value:
         return None
-    if not value.isdigit():
+    try:
+        return int(value)
+    except ValueError:
         return None
-    return float(value) / 100.0
 
 
-def _parse_bearing(value: str) -> Optional[float]:
-    value = value.strip()
-    if not value:
-        return None
-    if not value.isdigit():
+def _parse_bearing(value: bytes) -> Optional[float]:
+    try:
+        return int(value) / 10.0
+    except ValueError:
         return None
-    return float(int(value)) / 10.0
 
 
-def _parse_mag_var(value: str) -> Optional[float]:
+def _parse_mag_var(value: bytes) -> Optional[float]:
     value = value.strip()
     if not value:
         return None
     sign = 1.0
-    if value[0] in {"W", "S", "-"}:
+    first = value[0:1]
+    if first in (b"W", b"S", b"-"):
         sign = -1.0
-    digits = value[1:] if value[0].isalpha() or value[0] in "+-" else value
-    digits = digits.strip()
-    if not digits.isdigit():
+    digits = value[1:] if first.isalpha() or first in (b"+", b"-") else value
+    try:
+        magnitude = int(digits)
+    except ValueError:
         return None
-    magnitude = int(digits)
-    if len(digits) >= 2:
+    if len(digits.strip()) >= 2:
         magnitude = magnitude / 10.0
     return sign * magnitude
 
 
-def _parse_lat(value: str) -> Optional[float]:
+# Degrees per hundredth of an arc second; lets the DMS combine be one multiply.
+_DEG_PER_CENTISECOND = 1.0 / 360000.0
+
+
+def _parse_lat(value: bytes) -> Optional[float]:
     value = value.strip()
     if len(value) < 9:
         return None
-    hemi = value[0].upper()
-    digits = value[1:]
     try:
-        deg = int(digits[0:2])
-        minutes = int(digits[2:4])
-        seconds = int(digits[4:6])
-        hundredths = int(digits[6:8])
+        packed = int(value[1:9])
     except ValueError:
         return None
-    result = deg + minutes / 60.0 + (seconds + hundredths / 100.0) / 3600.0
-    if hemi == "S":
-        result = -result
+    deg, rest = divmod(packed, 1_000_000)
+    minutes, centiseconds = divmod(rest, 10_000)
+    result = ((deg * 60 + minutes) * 6_000 + centiseconds) * _DEG_PER_CENTISECOND
+    if value[0] in b"Ss":
+        return -result
     return result
 
 
-def _parse_lon(value: str) -> Optional[float]:
+def _parse_lon(value: bytes) -> Optional[float]:
     value = value.strip()
     if len(value) < 10:
         return None
-    hemi = value[0].upper()
-    digits = value[1:]
     try:
-        deg = int(digits[0:3])
-        minutes = int(digits[3:5])
-        seconds = int(digits[5:7])
-        hundredths = int(digits[7:9])
+        packed = int(value[1:10])
     except ValueError:
         return None
-    result = deg + minutes / 60.0 + (seconds + hundredths / 100.0) / 3600.0
-    if hemi == "W":
-        result = -result
+    deg, rest = divmod(packed, 1_000_000)
+    minutes, centiseconds = divmod(rest, 10_000)
+    result = ((deg * 60 + minutes) * 6_000 + centiseconds) * _DEG_PER_CENTISECOND
+    if value[0] in b"Ww":
+        return -result
     return result
 
 
-def _parse_limit(raw: str) -> tuple[Optional[str], Optional[int]]:
+_LIMIT_RE = re.compile(rb"(GND|SFC|UNL|UNLTD)|FL(\d+)|(\d+)|([A-Za-z]{2})(\d+)")
+
+
+def _parse_limit(raw: bytes) -> tuple[Optional[str], Optional[int]]:
     value = raw.strip()
     if not value:
         return None, None
-    if value in {"GND", "SFC", "UNL", "UNLTD"}:
-        return value, None
-    if value.startswith("FL") and value[2:].isdigit():
-        return "FL", int(value[2:])
-    if value.isdigit():
-        return None, int(value)
-    if value[:2].isalpha() and value[2:].isdigit():
-        return value[:2], int(value[2:])
-    return value, None
+    match = _LIMIT_RE.fullmatch(value)
+    if match is None:
+        return value.decode("ascii", "ignore"), None
+    keyword, flight_level, plain, ref, ref_value = match.groups()
+    if keyword is not None:
+        return keyword.decode("ascii"), None
+    if flight_level is not None:
+        return "FL", int(flight_level)
+    if plain is not None:
+        return None, int(plain)
+    return ref.decode("ascii"), int(ref_value)
@@ -69,6 +69,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Apply the bundled schema migration before import.",
     )
+    import_parser.add_argument(
+        "--bulk-initial",
+        action="store_true",
+        help="Drop non-unique indexes during the load and rebuild them after.",
+    )
     import_parser.add_argument(
         "--schema",
         help="Target Postgres schema (default: ofmx).",
@@ -154,6 +159,7 @@ def main(argv: list[str] | None = None) -> int:
             openair_path=args.openair if source_format == "arinc" else None,
             source_format=source_format,
             apply_migrations=args.apply_migrations,
+            bulk_initial=args.bulk_initial,
             dry_run=args.dry_run,
             verbose=args.verbose,
             schema=args.schema,
@@ -205,38 +211,38 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+_CONFIG_FIELDS: tuple[tuple[str, object, type], ...] = (
+    ("dsn", None, str),
+    ("ofmx", None, Path),
+    ("arinc", None, Path),
+    ("shapes", None, Path),
+    ("openair", None, Path),
+    ("apply_migrations", False, bool),
+    ("bulk_initial", False, bool),
+    ("dry_run", False, bool),
+    ("verbose", False, bool),
+    ("schema", None, str),
+    ("output_json", False, bool),
+    ("filter_source", None, str),
+    ("filter_cycle", None, str),
+)
+
+
 def _apply_config(args: argparse.Namespace) -> None:
     if not args.config:
         return
     config = configparser.ConfigParser()
     config.read(args.config)
-    section = config["ofmx2pgsql"] if "ofmx2pgsql" in config else None
-    if section is None:
+    if "ofmx2pgsql" not in config:
         return
-    if getattr(args, "dsn", None) is None and "dsn" in section:
-        args.dsn = section.get("dsn")
-    if getattr(args, "ofmx", None) is None and "ofmx" in section:
-        args.ofmx = Path(section.get("ofmx"))
-    if getattr(args, "arinc", None) is None and "arinc" in section:
-        args.arinc = Path(section.get("arinc"))
-    if getattr(args, "shapes", None) is None and "shapes" in section:
-        args.shapes = Path(section.get("shapes"))
-    if getattr(args, "openair", None) is None and "openair" in section:
-        args.openair = Path(section.get("openair"))
-    if getattr(args, "apply_migrations", None) is False and "apply_migrations" in section:
-        args.apply_migrations = section.getboolean("apply_migrations")
-    if getattr(args, "dry_run", None) is False and "dry_run" in section:
-        args.dry_run = section.getboolean("dry_run")
-    if getattr(args, "verbose", None) is False and "verbose" in section:
-        args.verbose = section.getboolean("verbose")
-    if getattr(args, "schema", None) is None and "schema" in section:
-        args.schema = section.get("schema")
-    if getattr(args, "output_json", None) is False and "output_json" in section:
-        args.output_json = section.getboolean("output_json")
-    if getattr(args, "filter_source", None) is None and "filter_source" in section:
-        args.filter_source = section.get("filter_source")
-    if getattr(args, "filter_cycle", None) is None and "filter_cycle" in section:
-        args.filter_cycle = section.get("filter_cycle")
+    section = config["ofmx2pgsql"]
+    for attr, unset, coerce in _CONFIG_FIELDS:
+        if attr not in section or getattr(args, attr, unset) is not unset:
+            continue
+        if coerce is bool:
+            setattr(args, attr, section.getboolean(attr))
+        else:
+            setattr(args, attr, coerce(section.get(attr)))
 
 
 def _finalize_schema(args: argparse.Namespace) -> None:
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 import importlib.resources as resources
-from typing import Iterable, Mapping
+from typing import Iterable, Mapping, Sequence
+import functools
+import itertools
+import operator
+import os
+import queue
 import re
+import struct
 import unicodedata
 
 from . import arinc, openair, parser
@@ -27,11 +36,20 @@ def import_dataset(
     openair_path: Path | None = None,
     source_format: str = "ofmx",
     apply_migrations: bool = False,
+    bulk_initial: bool = False,
+    batch_size: int | None = None,
     dry_run: bool = False,
     verbose: bool = False,
     schema: str = "ofmx",
 ) -> dict[str, int]:
-    """Import an OFMX or ARINC snapshot into PostGIS."""
+    """Import an OFMX or ARINC snapshot into PostGIS.
+
+    With ``bulk_initial`` the non-unique indexes on the target tables are
+    dropped before the loaders run and rebuilt afterwards, which is faster
+    for imports into empty or near-empty tables. ``batch_size`` caps the
+    rows staged per transaction (default 50,000, or the
+    ``OFMX2PGSQL_BATCH_SIZE`` environment variable).
+    """
 
     if dry_run:
         counts = summarize_dataset(source_path, shapes_path, source_format=source_format)
@@ -41,37 +59,104 @@ def import_dataset(
 
     _ensure_driver()
     schema = _validate_schema(schema)
+    if batch_size is None:
+        batch_size = int(os.environ.get("OFMX2PGSQL_BATCH_SIZE", _DEFAULT_BATCH_SIZE))
     parser_module = _select_parser(source_format)
     source_label = _source_label(source_format)
     cycle = _source_cycle(source_format, source_path)
-    with psycopg.connect(dsn) as conn:
-        conn.execute(f"SET search_path = {schema}, public")
-        if apply_migrations:
+    if apply_migrations:
+        with psycopg.connect(dsn) as conn:
+            conn.execute(f"SET search_path = {schema}, public")
             apply_schema_migration(conn, schema=schema)
-        counts = {
-            "airports": _load_airports(conn, parser_module, source_path, schema, source_label, cycle),
-            "runways": _load_runways(conn, parser_module, source_path, schema, source_label, cycle),
-            "runway_ends": _load_runway_ends(
-                conn, parser_module, source_path, schema, source_label, cycle
-            ),
-            "airspaces": _load_airspaces(
-                conn,
-                parser_module,
-                source_path,
-                shapes_path if source_format == "ofmx" else None,
-                schema,
-                source_label,
-                cycle,
-                openair_path if source_format == "arinc" else None,
-            ),
-            "navaids": _load_navaids(conn, parser_module, source_path, schema, source_label, cycle),
-            "waypoints": _load_waypoints(
-                conn, parser_module, source_path, schema, source_label, cycle
-            ),
-        }
-        if verbose:
-            _print_counts("Import summary", counts)
-        return counts
+    shapes = _collect_airspace_shapes(
+        parser_module, shapes_path if source_format == "ofmx" else None
+    )
+    openair_shapes = _collect_openair_shapes(
+        openair_path if source_format == "arinc" else None
+    )
+
+    def run(loader, *args) -> int:
+        with psycopg.connect(dsn) as conn:
+            conn.execute(f"SET search_path = {schema}, public")
+            # The temp stages write no WAL; this also skips the synchronous
+            # WAL flush when each batch commits. A crash at worst drops the
+            # latest commits of this import, which is re-runnable.
+            conn.execute("SET synchronous_commit = off")
+            return loader(conn, *args, schema, source_label, cycle, batch_size)
+
+    index_defs = _drop_secondary_indexes(dsn, schema) if bulk_initial else []
+    for definition in index_defs:
+        # Leave a recovery record in the output: if the rebuild below never
+        # runs (killed process, lost connection), the operator still has the
+        # statement that restores each dropped index.
+        print(f"bulk-initial: dropped index, rebuild with: {definition}")
+
+    # The parse thread fans records into per-kind queues so the streaming
+    # loaders COPY concurrently with the source walk; runways and runway
+    # ends are buffered instead because runway geometry needs the complete
+    # runway-end stream, and their merges must follow airports so foreign
+    # keys see their referenced rows committed.
+    # Bounded queues backpressure the parse thread against the slowest
+    # loader, so in-flight records stay on the order of one batch per kind
+    # instead of the whole dataset when Postgres ingests slower than the
+    # parser produces.
+    streamed_kinds = ("airport", "airspace", "navaid", "waypoint")
+    queues: dict[str, "queue.Queue"] = {
+        kind: queue.Queue(maxsize=batch_size) for kind in streamed_kinds
+    }
+
+    def run_streamed(loader, kind, *args) -> int:
+        try:
+            return run(loader, _drain(queues[kind]), *args)
+        except BaseException:
+            # Keep consuming to the sentinel so the parse thread is never
+            # left blocked on a full queue once this loader stops draining.
+            _discard(queues[kind])
+            raise
+
+    def parse() -> tuple[list[parser.Runway], list[parser.RunwayEnd]]:
+        runways: list[parser.Runway] = []
+        ends: list[parser.RunwayEnd] = []
+        try:
+            for kind, record in parser_module.iter_all(source_path):
+                q = queues.get(kind)
+                if q is not None:
+                    q.put(record)
+                elif kind == "runway":
+                    runways.append(record)
+                else:
+                    ends.append(record)
+        finally:
+            for q in queues.values():
+                q.put(_QUEUE_END)
+        return runways, ends
+
+    counts: dict[str, int] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            parsed = executor.submit(parse)
+            streamed = {
+                "airports": executor.submit(run_streamed, _load_airports, "airport"),
+                "airspaces": executor.submit(
+                    run_streamed, _load_airspaces, "airspace", shapes, openair_shapes
+                ),
+                "navaids": executor.submit(run_streamed, _load_navaids, "navaid"),
+                "waypoints": executor.submit(run_streamed, _load_waypoints, "waypoint"),
+            }
+            runways, ends = parsed.result()
+            counts["airports"] = streamed.pop("airports").result()
+            counts["runways"] = run(_load_runways, runways, _collect_runway_geoms(ends))
+            counts["runway_ends"] = run(_load_runway_ends, ends)
+            for name, future in streamed.items():
+                counts[name] = future.result()
+    finally:
+        # Rebuild even when the load fails: the dropped definitions exist
+        # only in memory, so skipping this on error would lose the indexes.
+        if index_defs:
+            _recreate_indexes(dsn, index_defs)
+    if verbose:
+        _print_counts("Import summary", counts)
+    return counts
 
 
 def validate_dataset(
@@ -89,17 +174,27 @@ def validate_dataset(
 
     _ensure_driver()
     schema = _validate_schema(schema)
-    parser_module = _select_parser(source_format)
-    with psycopg.connect(dsn) as conn:
-        conn.execute(f"SET search_path = {schema}, public")
-        if apply_migrations:
-            apply_schema_migration(conn, schema=schema)
-        parsed = summarize_dataset(source_path, shapes_path, source_format=source_format)
-        stored = _fetch_table_counts(conn, schema, filter_source, filter_cycle)
+    # Parse in a worker thread so the source walk overlaps the database
+    # round trips instead of running after them.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        parsed_future = executor.submit(
+            summarize_dataset, source_path, shapes_path, source_format=source_format
+        )
+        with psycopg.connect(dsn) as conn:
+            conn.execute(f"SET search_path = {schema}, public")
+            if apply_migrations:
+                apply_schema_migration(conn, schema=schema)
+            stored = _fetch_table_counts(conn, schema, filter_source, filter_cycle)
+        parsed = parsed_future.result()
     return {"parsed": parsed, "stored": stored}
 
 
 def apply_schema_migration(conn: "psycopg.Connection", *, schema: str = "ofmx") -> None:
+    conn.execute(_migration_sql(schema))
+
+
+@functools.lru_cache(maxsize=8)
+def _migration_sql(schema: str) -> str:
     migration_path = Path(__file__).resolve().parents[2] / "sql" / "migrations" / "001_init.sql"
     if migration_path.exists():
         sql = migration_path.read_text(encoding="utf-8")
@@ -108,488 +203,444 @@ def apply_schema_migration(conn: "psycopg.Connection", *, schema: str = "ofmx")
             encoding="utf-8"
         )
     sql = sql.replace("CREATE SCHEMA IF NOT EXISTS ofmx;", f"CREATE SCHEMA IF NOT EXISTS {schema};")
-    sql = sql.replace("ofmx.", f"{schema}.")
-    conn.execute(sql)
+    return sql.replace("ofmx.", f"{schema}.")
+
+
+# One attrgetter call per record pulls all scalar columns as a tuple in C,
+# instead of a Python attribute lookup per field.
+_AIRPORT_FIELDS = operator.attrgetter(
+    "ofmx_id",
+    "region",
+    "code_id",
+    "code_icao",
+    "code_gps",
+    "code_type",
+    "name",
+    "city",
+    "elevation",
+    "elevation_uom",
+    "mag_var",
+    "mag_var_year",
+    "transition_alt",
+    "transition_alt_uom",
+    "remarks",
+)
 
 
 def _load_airports(
     conn: "psycopg.Connection",
-    parser_module,
-    source_path: Path,
+    airports: Iterable[parser.Airport],
     schema: str,
     source_label: str | None,
     cycle: str | None,
+    batch_size: int,
 ) -> int:
-    rows = [
-        (
-            airport.ofmx_id,
-            airport.region,
-            airport.code_id,
-            airport.code_icao,
-            airport.code_gps,
-            airport.code_type,
-            airport.name,
-            airport.city,
-            airport.elevation,
-            airport.elevation_uom,
-            airport.mag_var,
-            airport.mag_var_year,
-            airport.transition_alt,
-            airport.transition_alt_uom,
-            airport.remarks,
-            source_label,
-            cycle,
-            airport.longitude,
-            airport.latitude,
-        )
-        for airport in parser_module.iter_airports(source_path)
-    ]
-    if not rows:
-        return 0
-    _executemany(
+    rows = (
+        _AIRPORT_FIELDS(airport)
+        + (source_label, cycle, _point_ewkb(airport.longitude, airport.latitude))
+        for airport in airports
+    )
+    return _copy_upsert(
         conn,
-        f"""
-        INSERT INTO {schema}.airports (
-            ofmx_id,
-            region,
-            code_id,
-            code_icao,
-            code_gps,
-            code_type,
-            name,
-            city,
-            elevation,
-            elevation_uom,
-            mag_var,
-            mag_var_year,
-            transition_alt,
-            transition_alt_uom,
-            remarks,
-            source,
-            cycle,
-            geom
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-            ST_SetSRID(ST_MakePoint(%s, %s), 4326)
-        )
-        ON CONFLICT (ofmx_id) DO UPDATE SET
-            region = EXCLUDED.region,
-            code_id = EXCLUDED.code_id,
-            code_icao = EXCLUDED.code_icao,
-            code_gps = EXCLUDED.code_gps,
-            code_type = EXCLUDED.code_type,
-            name = EXCLUDED.name,
-            city = EXCLUDED.city,
-            elevation = EXCLUDED.elevation,
-            elevation_uom = EXCLUDED.elevation_uom,
-            mag_var = EXCLUDED.mag_var,
-            mag_var_year = EXCLUDED.mag_var_year,
-            transition_alt = EXCLUDED.transition_alt,
-            transition_alt_uom = EXCLUDED.transition_alt_uom,
-            remarks = EXCLUDED.remarks,
-            source = EXCLUDED.source,
-            cycle = EXCLUDED.cycle,
-            geom = EXCLUDED.geom
-        """,
+        schema,
+        "airports",
+        (
+            "ofmx_id",
+            "region",
+            "code_id",
+            "code_icao",
+            "code_gps",
+            "code_type",
+            "name",
+            "city",
+            "elevation",
+            "elevation_uom",
+            "mag_var",
+            "mag_var_year",
+            "transition_alt",
+            "transition_alt_uom",
+            "remarks",
+            "source",
+            "cycle",
+            "geom",
+        ),
         rows,
+        batch_size=batch_size,
     )
-    return len(rows)
+
+
+_RUNWAY_FIELDS = operator.attrgetter(
+    "ofmx_id",
+    "airport_ofmx_id",
+    "designator",
+    "length",
+    "width",
+    "uom_dim_rwy",
+    "surface",
+    "preparation",
+    "pcn_note",
+    "strip_length",
+    "strip_width",
+    "uom_dim_strip",
+)
 
 
 def _load_runways(
     conn: "psycopg.Connection",
-    parser_module,
-    source_path: Path,
+    runways: Iterable[parser.Runway],
+    runway_geoms: Mapping[str, str],
     schema: str,
     source_label: str | None,
     cycle: str | None,
+    batch_size: int,
 ) -> int:
-    runway_endpoints = _collect_runway_endpoints(parser_module, source_path)
-    rows = []
-    for runway in parser_module.iter_runways(source_path):
-        geom = _line_wkt(runway_endpoints.get(runway.ofmx_id, []))
-        rows.append(
-            (
-                runway.ofmx_id,
-                runway.airport_ofmx_id,
-                runway.designator,
-                runway.length,
-                runway.width,
-                runway.uom_dim_rwy,
-                runway.surface,
-                runway.preparation,
-                runway.pcn_note,
-                runway.strip_length,
-                runway.strip_width,
-                runway.uom_dim_strip,
-                source_label,
-                cycle,
-                geom,
-                geom,
-            )
-        )
-    if not rows:
-        return 0
-    _executemany(
+    rows = (
+        _RUNWAY_FIELDS(runway)
+        + (source_label, cycle, runway_geoms.get(runway.ofmx_id))
+        for runway in runways
+    )
+    return _copy_upsert(
         conn,
-        f"""
-        INSERT INTO {schema}.runways (
-            ofmx_id,
-            airport_ofmx_id,
-            designator,
-            length,
-            width,
-            uom_dim_rwy,
-            surface,
-            preparation,
-            pcn_note,
-            strip_length,
-            strip_width,
-            uom_dim_strip,
-            source,
-            cycle,
-            geom
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-            CASE WHEN %s::text IS NULL THEN NULL ELSE ST_SetSRID(ST_GeomFromText(%s::text), 4326) END
-        )
-        ON CONFLICT (ofmx_id) DO UPDATE SET
-            airport_ofmx_id = EXCLUDED.airport_ofmx_id,
-            designator = EXCLUDED.designator,
-            length = EXCLUDED.length,
-            width = EXCLUDED.width,
-            uom_dim_rwy = EXCLUDED.uom_dim_rwy,
-            surface = EXCLUDED.surface,
-            preparation = EXCLUDED.preparation,
-            pcn_note = EXCLUDED.pcn_note,
-            strip_length = EXCLUDED.strip_length,
-            strip_width = EXCLUDED.strip_width,
-            uom_dim_strip = EXCLUDED.uom_dim_strip,
-            source = EXCLUDED.source,
-            cycle = EXCLUDED.cycle,
-            geom = EXCLUDED.geom
-        """,
+        schema,
+        "runways",
+        (
+            "ofmx_id",
+            "airport_ofmx_id",
+            "designator",
+            "length",
+            "width",
+            "uom_dim_rwy",
+            "surface",
+            "preparation",
+            "pcn_note",
+            "strip_length",
+            "strip_width",
+            "uom_dim_strip",
+            "source",
+            "cycle",
+            "geom",
+        ),
         rows,
+        batch_size=batch_size,
     )
-    return len(rows)
+
+
+_RUNWAY_END_FIELDS = operator.attrgetter(
+    "ofmx_id",
+    "runway_ofmx_id",
+    "airport_ofmx_id",
+    "designator",
+    "true_bearing",
+    "mag_bearing",
+)
 
 
 def _load_runway_ends(
     conn: "psycopg.Connection",
-    parser_module,
-    source_path: Path,
+    ends: Iterable[parser.RunwayEnd],
     schema: str,
     source_label: str | None,
     cycle: str | None,
+    batch_size: int,
 ) -> int:
-    rows = [
-        (
-            end.ofmx_id,
-            end.runway_ofmx_id,
-            end.airport_ofmx_id,
-            end.designator,
-            end.true_bearing,
-            end.mag_bearing,
-            source_label,
-            cycle,
-            end.longitude,
-            end.latitude,
-        )
-        for end in parser_module.iter_runway_ends(source_path)
-    ]
-    if not rows:
-        return 0
-    _executemany(
+    rows = (
+        _RUNWAY_END_FIELDS(end)
+        + (source_label, cycle, _point_ewkb(end.longitude, end.latitude))
+        for end in ends
+    )
+    return _copy_upsert(
         conn,
-        f"""
-        INSERT INTO {schema}.runway_ends (
-            ofmx_id,
-            runway_ofmx_id,
-            airport_ofmx_id,
-            designator,
-            true_bearing,
-            mag_bearing,
-            source,
-            cycle,
-            geom
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s,
-            ST_SetSRID(ST_MakePoint(%s, %s), 4326)
-        )
-        ON CONFLICT (ofmx_id) DO UPDATE SET
-            runway_ofmx_id = EXCLUDED.runway_ofmx_id,
-            airport_ofmx_id = EXCLUDED.airport_ofmx_id,
-            designator = EXCLUDED.designator,
-            true_bearing = EXCLUDED.true_bearing,
-            mag_bearing = EXCLUDED.mag_bearing,
-            source = EXCLUDED.source,
-            cycle = EXCLUDED.cycle,
-            geom = EXCLUDED.geom
-        """,
+        schema,
+        "runway_ends",
+        (
+            "ofmx_id",
+            "runway_ofmx_id",
+            "airport_ofmx_id",
+            "designator",
+            "true_bearing",
+            "mag_bearing",
+            "source",
+            "cycle",
+            "geom",
+        ),
         rows,
+        batch_size=batch_size,
     )
-    return len(rows)
+
+
+_AIRSPACE_FIELDS = operator.attrgetter(
+    "ofmx_id",
+    "region",
+    "code_id",
+    "code_type",
+    "name",
+    "name_alt",
+    "airspace_class",
+    "upper_ref",
+    "upper_value",
+    "upper_uom",
+    "lower_ref",
+    "lower_value",
+    "lower_uom",
+    "remarks",
+)
 
 
 def _load_airspaces(
     conn: "psycopg.Connection",
-    parser_module,
-    source_path: Path,
-    shapes_path: Path | None,
+    airspaces: Iterable[parser.Airspace],
+    shapes: Mapping[str, list[tuple[float, float]]],
+    openair_shapes: Mapping[tuple[str, str | None], list[tuple[float, float]]],
     schema: str,
     source_label: str | None,
     cycle: str | None,
-    openair_path: Path | None,
+    batch_size: int,
 ) -> int:
-    shapes = _collect_airspace_shapes(parser_module, shapes_path) if shapes_path else {}
-    openair_shapes = _collect_openair_shapes(openair_path) if openair_path else {}
-    rows = []
-    for airspace in parser_module.iter_airspaces(source_path):
-        shape = shapes.get(airspace.ofmx_id)
-        if shape is None and openair_shapes:
-            key = (_normalize_name(airspace.name), _normalize_class(airspace.airspace_class))
-            shape = openair_shapes.get(key)
-        polygon = _polygon_wkt(shape) if shape else None
-        rows.append(
-            (
-                airspace.ofmx_id,
-                airspace.region,
-                airspace.code_id,
-                airspace.code_type,
-                airspace.name,
-                airspace.name_alt,
-                airspace.airspace_class,
-                airspace.upper_ref,
-                airspace.upper_value,
-                airspace.upper_uom,
-                airspace.lower_ref,
-                airspace.lower_value,
-                airspace.lower_uom,
-                airspace.remarks,
-                source_label,
-                cycle,
-                polygon,
-                polygon,
-            )
-        )
-    if not rows:
-        return 0
-    _executemany(
+    rows = (
+        _AIRSPACE_FIELDS(airspace)
+        + (source_label, cycle, _airspace_geom(airspace, shapes, openair_shapes))
+        for airspace in airspaces
+    )
+    return _copy_upsert(
         conn,
-        f"""
-        INSERT INTO {schema}.airspaces (
-            ofmx_id,
-            region,
-            code_id,
-            code_type,
-            name,
-            name_alt,
-            airspace_class,
-            upper_ref,
-            upper_value,
-            upper_uom,
-            lower_ref,
-            lower_value,
-            lower_uom,
-            remarks,
-            source,
-            cycle,
-            geom
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-            CASE WHEN %s::text IS NULL THEN NULL ELSE ST_Multi(ST_SetSRID(ST_GeomFromText(%s::text), 4326)) END
-        )
-        ON CONFLICT (ofmx_id, region, code_id, code_type, name) DO UPDATE SET
-            name = EXCLUDED.name,
-            name_alt = EXCLUDED.name_alt,
-            airspace_class = EXCLUDED.airspace_class,
-            upper_ref = EXCLUDED.upper_ref,
-            upper_value = EXCLUDED.upper_value,
-            upper_uom = EXCLUDED.upper_uom,
-            lower_ref = EXCLUDED.lower_ref,
-            lower_value = EXCLUDED.lower_value,
-            lower_uom = EXCLUDED.lower_uom,
-            remarks = EXCLUDED.remarks,
-            source = EXCLUDED.source,
-            cycle = EXCLUDED.cycle,
-            geom = EXCLUDED.geom
-        """,
+        schema,
+        "airspaces",
+        (
+            "ofmx_id",
+            "region",
+            "code_id",
+            "code_type",
+            "name",
+            "name_alt",
+            "airspace_class",
+            "upper_ref",
+            "upper_value",
+            "upper_uom",
+            "lower_ref",
+            "lower_value",
+            "lower_uom",
+            "remarks",
+            "source",
+            "cycle",
+            "geom",
+        ),
         rows,
+        conflict_columns=("ofmx_id", "region", "code_id", "code_type", "name"),
+        batch_size=batch_size,
     )
-    return len(rows)
+
+
+_NAVAID_FIELDS = operator.attrgetter(
+    "ofmx_id",
+    "region",
+    "code_id",
+    "name",
+    "navaid_type",
+    "code_type",
+    "frequency",
+    "frequency_uom",
+    "channel",
+    "ghost_frequency",
+    "elevation",
+    "elevation_uom",
+    "mag_var",
+    "datum",
+    "associated_vor_ofmx_id",
+)
 
 
 def _load_navaids(
     conn: "psycopg.Connection",
-    parser_module,
-    source_path: Path,
+    navaids: Iterable[parser.Navaid],
     schema: str,
     source_label: str | None,
     cycle: str | None,
+    batch_size: int,
 ) -> int:
-    rows = []
-    for nav in parser_module.iter_navaids(source_path):
-        if nav.longitude is None or nav.latitude is None:
-            continue
-        rows.append(
-            (
-                nav.ofmx_id,
-                nav.region,
-                nav.code_id,
-                nav.name,
-                nav.navaid_type,
-                nav.code_type,
-                nav.frequency,
-                nav.frequency_uom,
-                nav.channel,
-                nav.ghost_frequency,
-                nav.elevation,
-                nav.elevation_uom,
-                nav.mag_var,
-                nav.datum,
-                nav.associated_vor_ofmx_id,
-                source_label,
-                cycle,
-                nav.longitude,
-                nav.latitude,
-            )
-        )
-    if not rows:
-        return 0
-    _executemany(
+    rows = (
+        _NAVAID_FIELDS(nav)
+        + (source_label, cycle, _point_ewkb(nav.longitude, nav.latitude))
+        for nav in navaids
+        if nav.longitude is not None and nav.latitude is not None
+    )
+    return _copy_upsert(
         conn,
-        f"""
-        INSERT INTO {schema}.navaids (
-            ofmx_id,
-            region,
-            code_id,
-            name,
-            navaid_type,
-            code_type,
-            frequency,
-            frequency_uom,
-            channel,
-            ghost_frequency,
-            elevation,
-            elevation_uom,
-            mag_var,
-            datum,
-            associated_vor_ofmx_id,
-            source,
-            cycle,
-            geom
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-            ST_SetSRID(ST_MakePoint(%s, %s), 4326)
-        )
-        ON CONFLICT (ofmx_id) DO UPDATE SET
-            region = EXCLUDED.region,
-            code_id = EXCLUDED.code_id,
-            name = EXCLUDED.name,
-            navaid_type = EXCLUDED.navaid_type,
-            code_type = EXCLUDED.code_type,
-            frequency = EXCLUDED.frequency,
-            frequency_uom = EXCLUDED.frequency_uom,
-            channel = EXCLUDED.channel,
-            ghost_frequency = EXCLUDED.ghost_frequency,
-            elevation = EXCLUDED.elevation,
-            elevation_uom = EXCLUDED.elevation_uom,
-            mag_var = EXCLUDED.mag_var,
-            datum = EXCLUDED.datum,
-            associated_vor_ofmx_id = EXCLUDED.associated_vor_ofmx_id,
-            source = EXCLUDED.source,
-            cycle = EXCLUDED.cycle,
-            geom = EXCLUDED.geom
-        """,
+        schema,
+        "navaids",
+        (
+            "ofmx_id",
+            "region",
+            "code_id",
+            "name",
+            "navaid_type",
+            "code_type",
+            "frequency",
+            "frequency_uom",
+            "channel",
+            "ghost_frequency",
+            "elevation",
+            "elevation_uom",
+            "mag_var",
+            "datum",
+            "associated_vor_ofmx_id",
+            "source",
+            "cycle",
+            "geom",
+        ),
         rows,
+        batch_size=batch_size,
     )
-    return len(rows)
+
+
+_WAYPOINT_FIELDS = operator.attrgetter(
+    "ofmx_id",
+    "region",
+    "code_id",
+    "name",
+    "point_type",
+)
 
 
 def _load_waypoints(
     conn: "psycopg.Connection",
-    parser_module,
-    source_path: Path,
+    waypoints: Iterable[parser.Waypoint],
     schema: str,
     source_label: str | None,
     cycle: str | None,
+    batch_size: int,
 ) -> int:
-    rows = [
-        (
-            point.ofmx_id,
-            point.region,
-            point.code_id,
-            point.name,
-            point.point_type,
-            source_label,
-            cycle,
-            point.longitude,
-            point.latitude,
-        )
-        for point in parser_module.iter_waypoints(source_path)
-    ]
-    if not rows:
-        return 0
-    _executemany(
+    rows = (
+        _WAYPOINT_FIELDS(point)
+        + (source_label, cycle, _point_ewkb(point.longitude, point.latitude))
+        for point in waypoints
+    )
+    return _copy_upsert(
         conn,
-        f"""
-        INSERT INTO {schema}.waypoints (
-            ofmx_id,
-            region,
-            code_id,
-            name,
-            point_type,
-            source,
-            cycle,
-            geom
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s,
-            ST_SetSRID(ST_MakePoint(%s, %s), 4326)
-        )
-        ON CONFLICT (ofmx_id) DO UPDATE SET
-            region = EXCLUDED.region,
-            code_id = EXCLUDED.code_id,
-            name = EXCLUDED.name,
-            point_type = EXCLUDED.point_type,
-            source = EXCLUDED.source,
-            cycle = EXCLUDED.cycle,
-            geom = EXCLUDED.geom
-        """,
+        schema,
+        "waypoints",
+        (
+            "ofmx_id",
+            "region",
+            "code_id",
+            "name",
+            "point_type",
+            "source",
+            "cycle",
+            "geom",
+        ),
         rows,
+        batch_size=batch_size,
     )
-    return len(rows)
 
 
-def _collect_runway_endpoints(
-    parser_module, source_path: Path
-) -> Mapping[str, list[tuple[float, float]]]:
-    endpoints: dict[str, list[tuple[float, float]]] = {}
-    for end in parser_module.iter_runway_ends(source_path):
+_QUEUE_END = object()
+
+
+def _drain(q: "queue.Queue") -> Iterable:
+    while True:
+        record = q.get()
+        if record is _QUEUE_END:
+            # Leave the sentinel in place (the queue is empty by now) so a
+            # later _discard on this queue returns instead of blocking.
+            q.put(_QUEUE_END)
+            return
+        yield record
+
+
+def _discard(q: "queue.Queue") -> None:
+    """Consume a queue through its sentinel so the producer never blocks."""
+
+    while True:
+        if q.get() is _QUEUE_END:
+            q.put(_QUEUE_END)
+            return
+
+
+def _collect_runway_geoms(ends: Iterable[parser.RunwayEnd]) -> Mapping[str, str]:
+    """Map runway ids to two-point hex EWKB lines from the first two located ends.
+
+    Coordinates go straight into the packed buffer as ends pair up, so no
+    boxed coordinate containers outlive the scan.
+    """
+
+    partial: dict[str, tuple[float, float]] = {}
+    geoms: dict[str, str] = {}
+    for end in ends:
         if end.longitude is None or end.latitude is None:
             continue
-        endpoints.setdefault(end.runway_ofmx_id or "", []).append((end.longitude, end.latitude))
-    return endpoints
+        key = end.runway_ofmx_id or ""
+        if key in geoms:
+            continue
+        first = partial.pop(key, None)
+        if first is None:
+            partial[key] = (end.longitude, end.latitude)
+        else:
+            geoms[key] = _line_ewkb(*first, end.longitude, end.latitude)
+    return geoms
 
 
 def _collect_airspace_shapes(
     parser_module, path: Path | None
-) -> Mapping[str, list[tuple[float, float]]]:
+) -> Mapping[str, array]:
     if path is None:
         return {}
-    shapes: dict[str, list[tuple[float, float]]] = {}
-    for shape in parser_module.iter_airspace_shapes(path):
+    stat = path.stat()
+    return _airspace_shapes_cached(parser_module, str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _airspace_shapes_cached(
+    parser_module, path: str, mtime_ns: int, size: int
+) -> Mapping[str, array]:
+    shapes: dict[str, array] = {}
+    for shape in parser_module.iter_airspace_shapes(Path(path)):
         shapes[shape.ofmx_id] = shape.positions
-    return shapes
+    return MappingProxyType(shapes)
+
+
+def _airspace_geom(
+    airspace: parser.Airspace,
+    shapes: Mapping[str, array],
+    openair_shapes: Mapping[tuple[str, str | None], array],
+) -> str | None:
+    shape = shapes.get(airspace.ofmx_id)
+    if shape is None and openair_shapes:
+        key = (_normalize_name(airspace.name), _normalize_class(airspace.airspace_class))
+        shape = openair_shapes.get(key)
+    return _multipolygon_ewkb(shape) if shape else None
 
 
 def _collect_openair_shapes(
     path: Path | None,
-) -> Mapping[tuple[str, str | None], list[tuple[float, float]]]:
+) -> Mapping[tuple[str, str | None], array]:
     if path is None:
         return {}
-    return openair.build_shape_index(path)
+    stat = path.stat()
+    return _openair_shapes_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _openair_shapes_cached(
+    path: str, mtime_ns: int, size: int
+) -> Mapping[tuple[str, str | None], array]:
+    # Flatten the tuple lists into the same interleaved-double buffers the
+    # shape extension yields; the name and name+class keys share a list,
+    # so convert each list once.
+    flat: dict[tuple[str, str | None], array] = {}
+    converted: dict[int, array] = {}
+    for key, points in openair.build_shape_index(Path(path)).items():
+        buffer = converted.get(id(points))
+        if buffer is None:
+            buffer = array("d", itertools.chain.from_iterable(points))
+            converted[id(points)] = buffer
+        flat[key] = buffer
+    return MappingProxyType(flat)
+
 
+_DECIMAL_RE = re.compile(r"\d+\.\d+")
 
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_name(value: str | None) -> str:
     if value is None:
         return ""
@@ -597,7 +648,7 @@ def _normalize_name(value: str | None) -> str:
     tokens = normalized.strip().upper().split()
     if tokens[:1] == ["R"] and len(tokens) > 1 and tokens[1].startswith("LS"):
         tokens = tokens[1:]
-    while tokens and re.fullmatch(r"\d+\.\d+", tokens[-1]):
+    while tokens and _DECIMAL_RE.fullmatch(tokens[-1]):
         tokens.pop()
     return " ".join(tokens)
 
@@ -608,45 +659,40 @@ def _normalize_class(value: str | None) -> str | None:
     return value.strip().upper() or None
 
 
+# Singular iter_all kinds to the plural keys used in count summaries.
+_KIND_KEYS = {
+    "airport": "airports",
+    "runway": "runways",
+    "runway_end": "runway_ends",
+    "airspace": "airspaces",
+    "navaid": "navaids",
+    "waypoint": "waypoints",
+}
+
+
 def summarize_dataset(
     source_path: Path, shapes_path: Path | None, *, source_format: str = "ofmx"
 ) -> dict[str, int]:
     parser_module = _select_parser(source_format)
     if source_format == "arinc":
-        return {
-            "airports": _count_unique(parser_module.iter_airports(source_path)),
-            "runways": _count_unique(parser_module.iter_runways(source_path)),
-            "runway_ends": _count_unique(parser_module.iter_runway_ends(source_path)),
-            "airspaces": _count_unique(parser_module.iter_airspaces(source_path)),
-            "navaids": _count_unique(
-                parser_module.iter_navaids(source_path),
-                predicate=lambda nav: nav.longitude is not None and nav.latitude is not None,
-            ),
-            "waypoints": _count_unique(parser_module.iter_waypoints(source_path)),
-            "airspace_shapes": 0,
-        }
-    return {
-        "airports": sum(1 for _ in parser_module.iter_airports(source_path)),
-        "runways": sum(1 for _ in parser_module.iter_runways(source_path)),
-        "runway_ends": sum(1 for _ in parser_module.iter_runway_ends(source_path)),
-        "airspaces": sum(1 for _ in parser_module.iter_airspaces(source_path)),
-        "navaids": sum(1 for _ in parser_module.iter_navaids(source_path)),
-        "waypoints": sum(1 for _ in parser_module.iter_waypoints(source_path)),
-        "airspace_shapes": (
-            sum(1 for _ in parser_module.iter_airspace_shapes(shapes_path))
-            if shapes_path and source_format == "ofmx"
-            else 0
-        ),
-    }
-
-
-def _count_unique(records, predicate=None) -> int:
-    seen: set[str] = set()
-    for record in records:
-        if predicate is not None and not predicate(record):
-            continue
-        seen.add(record.ofmx_id)
-    return len(seen)
+        seen: dict[str, set[str]] = {kind: set() for kind in _KIND_KEYS}
+        # Bind the set.add methods once so the per-record loop does a dict
+        # lookup and one call instead of re-resolving the attribute.
+        adders = {kind: ids.add for kind, ids in seen.items()}
+        for kind, record in parser_module.iter_all(source_path):
+            if kind == "navaid" and (record.longitude is None or record.latitude is None):
+                continue
+            adders[kind](record.ofmx_id)
+        counts = {key: len(seen[kind]) for kind, key in _KIND_KEYS.items()}
+        counts["airspace_shapes"] = 0
+        return counts
+    counts = dict.fromkeys(_KIND_KEYS.values(), 0)
+    for kind, _ in parser_module.iter_all(source_path):
+        counts[_KIND_KEYS[kind]] += 1
+    counts["airspace_shapes"] = (
+        sum(1 for _ in parser_module.iter_airspace_shapes(shapes_path)) if shapes_path else 0
+    )
+    return counts
 
 
 def _select_parser(source_format: str):
@@ -667,22 +713,83 @@ def _source_cycle(source_format: str, source_path: Path) -> str | None:
     return None
 
 
-def _line_wkt(points: Iterable[tuple[float, float]]) -> str | None:
-    coords = list(points)
-    if len(coords) < 2:
+# Extended WKB, little endian: byte order, type | SRID flag, SRID.
+_EWKB_HEADER = struct.Struct("<BII")
+_EWKB_COUNT = struct.Struct("<I")
+_WKB_POINT = 1
+_WKB_LINESTRING = 2
+_WKB_POLYGON = 3
+_WKB_MULTIPOLYGON = 6
+_WKB_SRID_FLAG = 0x20000000
+_SRID_WGS84 = 4326
+
+
+def _ewkb_hex(geom_type: int, body: bytes) -> str:
+    return (_EWKB_HEADER.pack(1, geom_type | _WKB_SRID_FLAG, _SRID_WGS84) + body).hex()
+
+
+def _pack_coords(coords: Sequence[float]) -> bytes:
+    # `coords` is interleaved lon,lat doubles; one pack call emits the ring.
+    return _EWKB_COUNT.pack(len(coords) // 2) + struct.pack(f"<{len(coords)}d", *coords)
+
+
+_POINT_COORDS = struct.Struct("<2d")
+_LINE_COORDS = struct.Struct("<4d")
+
+
+def _point_ewkb(longitude: float | None, latitude: float | None) -> str | None:
+    if longitude is None or latitude is None:
         return None
-    parts = ", ".join(f"{lon} {lat}" for lon, lat in coords[:2])
-    return f"LINESTRING({parts})"
+    return _ewkb_hex(_WKB_POINT, _POINT_COORDS.pack(longitude, latitude))
+
+
+def _line_ewkb(lon1: float, lat1: float, lon2: float, lat2: float) -> str:
+    return _ewkb_hex(
+        _WKB_LINESTRING, _EWKB_COUNT.pack(2) + _LINE_COORDS.pack(lon1, lat1, lon2, lat2)
+    )
 
 
-def _polygon_wkt(points: Iterable[tuple[float, float]]) -> str | None:
-    coords = list(points)
-    if len(coords) < 3:
+def _multipolygon_ewkb(coords: Sequence[float]) -> str | None:
+    if len(coords) < 6:
         return None
-    if coords[0] != coords[-1]:
-        coords.append(coords[0])
-    parts = ", ".join(f"{lon} {lat}" for lon, lat in coords)
-    return f"POLYGON(({parts}))"
+    if coords[0] != coords[-2] or coords[1] != coords[-1]:
+        # Close the ring on a copy; shape buffers are shared via the caches.
+        coords = coords + coords[:2]
+    # One polygon holding a single closed ring; nested geometries carry
+    # their own byte-order/type header but no SRID.
+    polygon = struct.pack("<BII", 1, _WKB_POLYGON, 1) + _pack_coords(coords)
+    return _ewkb_hex(_WKB_MULTIPOLYGON, _EWKB_COUNT.pack(1) + polygon)
+
+
+def _drop_secondary_indexes(dsn: str, schema: str) -> list[str]:
+    """Drop non-unique indexes on the target tables and return their definitions.
+
+    Unique indexes stay in place because the merge ON CONFLICT targets
+    depend on them.
+    """
+
+    query = (
+        "SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid) "
+        "FROM pg_index i "
+        "JOIN pg_class t ON t.oid = i.indrelid "
+        "JOIN pg_namespace n ON n.oid = t.relnamespace "
+        "WHERE n.nspname = %s AND t.relname = ANY(%s) AND NOT i.indisunique"
+    )
+    with psycopg.connect(dsn) as conn:
+        rows = conn.execute(query, (schema, list(_KIND_KEYS.values()))).fetchall()
+        # Send the drops back-to-back and drain the responses once.
+        with conn.pipeline():
+            for name, _ in rows:
+                conn.execute(f"DROP INDEX {name}")
+    return [definition for _, definition in rows]
+
+
+def _recreate_indexes(dsn: str, index_defs: list[str]) -> None:
+    with psycopg.connect(dsn) as conn:
+        with conn.pipeline():
+            conn.execute("SET max_parallel_maintenance_workers = 4")
+            for definition in index_defs:
+                conn.execute(definition)
 
 
 def _fetch_table_counts(
@@ -700,11 +807,11 @@ def _fetch_table_counts(
         "waypoints": f"{schema}.waypoints",
     }
     where, params = _build_filter_clause(filter_source, filter_cycle)
-    counts: dict[str, int] = {}
-    for key, table in tables.items():
-        query = f"SELECT COUNT(*) FROM {table}{where}"
-        counts[key] = conn.execute(query, params).fetchone()[0]
-    return counts
+    # One UNION ALL statement instead of a round trip per table.
+    query = " UNION ALL ".join(
+        f"SELECT '{key}', COUNT(*) FROM {table}{where}" for key, table in tables.items()
+    )
+    return dict(conn.execute(query, params * len(tables)).fetchall())
 
 
 def _build_filter_clause(
@@ -724,14 +831,89 @@ def _build_filter_clause(
 
 
 def _print_counts(title: str, counts: dict[str, int]) -> None:
-    print(title)
-    for key, value in counts.items():
-        print(f"{key}: {value}")
+    lines = "\n".join(f"{key}: {value}" for key, value in counts.items())
+    print(f"{title}\n{lines}")
+
+
+_DEFAULT_BATCH_SIZE = 50_000
+
+
+def _copy_upsert(
+    conn: "psycopg.Connection",
+    schema: str,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[tuple],
+    conflict_columns: Sequence[str] = ("ofmx_id",),
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+) -> int:
+    """Stream rows through COPY into a temp stage, then merge into the target table.
 
+    Geometry values travel as hex EWKB text; ``_seq`` keeps last-wins semantics
+    when a batch repeats a conflict key. Rows are staged and committed in
+    ``batch_size`` chunks so neither side holds a transaction open over the
+    whole table.
+    """
 
-def _executemany(conn: "psycopg.Connection", query: str, rows: list[tuple]) -> None:
-    with conn.cursor() as cursor:
-        cursor.executemany(query, rows)
+    create, add_seq, copy_sql, probe, insert, merge = _upsert_sql(
+        schema, table, tuple(columns), tuple(conflict_columns)
+    )
+    rows = iter(rows)
+    total = 0
+    while True:
+        conn.execute(create)
+        conn.execute(add_seq)
+        count = 0
+        with conn.cursor() as cursor:
+            with cursor.copy(copy_sql) as copy:
+                for row in itertools.islice(rows, batch_size):
+                    copy.write_row(row)
+                    count += 1
+        if not count:
+            # Roll back the empty stage rather than committing its DDL.
+            conn.rollback()
+            return total
+        # An empty target (fresh migration, first load) takes the plain
+        # INSERT and skips the per-row uniqueness probe ON CONFLICT performs;
+        # later batches see the table filled and switch to the merge.
+        empty = conn.execute(probe).fetchone() is None
+        conn.execute(insert if empty else merge)
+        conn.commit()
+        total += count
+        if count < batch_size:
+            return total
+
+
+@functools.lru_cache(maxsize=16)
+def _upsert_sql(
+    schema: str,
+    table: str,
+    columns: tuple[str, ...],
+    conflict_columns: tuple[str, ...],
+) -> tuple[str, str, str, str, str, str]:
+    """Build the stage DDL, COPY, probe and merge statements for one target table."""
+
+    stage = f"_stage_{table}"
+    column_list = ", ".join(columns)
+    conflict_list = ", ".join(conflict_columns)
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}"
+        for column in columns
+        if column not in conflict_columns
+    )
+    insert = (
+        f"INSERT INTO {schema}.{table} ({column_list}) "
+        f"SELECT DISTINCT ON ({conflict_list}) {column_list} FROM {stage} "
+        f"ORDER BY {conflict_list}, _seq DESC"
+    )
+    return (
+        f"CREATE TEMP TABLE {stage} (LIKE {schema}.{table}) ON COMMIT DROP",
+        f"ALTER TABLE {stage} ADD COLUMN _seq BIGSERIAL",
+        f"COPY {stage} ({column_list}) FROM STDIN",
+        f"SELECT 1 FROM {schema}.{table} LIMIT 1",
+        insert,
+        f"{insert} ON CONFLICT ({conflict_list}) DO UPDATE SET {updates}",
+    )
 
 
 def _ensure_driver() -> None:
@@ -741,7 +923,12 @@ def _ensure_driver() -> None:
         ) from _PSYCOPG_IMPORT_ERROR
 
 
+# ASCII identifiers only, within Postgres's 63-byte name limit; str.isalnum
+# would wave through unicode letters and digits into interpolated SQL.
+_SCHEMA_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]{0,62}\Z")
+
+
 def _validate_schema(schema: str) -> str:
-    if not schema or not schema.replace("_", "").isalnum() or schema[0].isdigit():
+    if not _SCHEMA_RE.match(schema):
         raise ValueError(f"Invalid schema name: {schema}")
     return schema
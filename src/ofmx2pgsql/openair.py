@@ -5,13 +5,14 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterator, Optional
+import functools
 import io
 import re
 import unicodedata
 import zipfile
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OpenAirspace:
     name: str
     airspace_class: Optional[str]
@@ -47,26 +48,23 @@ def iter_airspaces(path: Path) -> Iterator[OpenAirspace]:
 
     for raw in _iter_lines(path):
         line = raw.strip()
-        if not line or line.startswith("*"):
+        if not line or line[0] == "*":
             continue
-        if line.startswith("AC "):
+        # One slice instead of a startswith per candidate prefix.
+        tag = line[:3]
+        if tag == "DP ":
+            coord = _parse_dp(line[3:])
+            if coord:
+                positions.append(coord)
+        elif tag == "AC ":
             yield from flush()
             current_class = line[3:].strip() or None
-            continue
-        if line.startswith("AN "):
+        elif tag == "AN ":
             current_name = line[3:].strip() or None
-            continue
-        if line.startswith("AL "):
+        elif tag == "AL ":
             current_lower = line[3:].strip() or None
-            continue
-        if line.startswith("AH "):
+        elif tag == "AH ":
             current_upper = line[3:].strip() or None
-            continue
-        if line.startswith("DP "):
-            coord = _parse_dp(line[3:])
-            if coord:
-                positions.append(coord)
-            continue
     yield from flush()
 
 
@@ -86,7 +84,7 @@ def _iter_lines(path: Path) -> Iterator[str]:
     if path.suffix.lower() == ".zip":
         yield from _iter_zip_lines(path)
         return
-    with path.open("r", encoding="utf-8", errors="ignore") as handle:
+    with path.open("r", encoding="utf-8", errors="ignore", buffering=1 << 20) as handle:
         for line in handle:
             yield line.rstrip("\r\n")
 
@@ -98,13 +96,32 @@ def _iter_zip_lines(path: Path) -> Iterator[str]:
             return
         preferred = [name for name in members if "/isolated/" in name and "seeyou" in name]
         target = preferred[0] if preferred else members[0]
+        # Typical datasets fit in memory: inflate once, decode once, split
+        # once, instead of TextIOWrapper's incremental per-line decoding.
+        if archive.getinfo(target).file_size < (1 << 24):
+            yield from archive.read(target).decode("utf-8", "ignore").splitlines()
+            return
         with archive.open(target) as handle:
-            wrapper = io.TextIOWrapper(handle, encoding="utf-8", errors="ignore")
+            # A large read buffer amortizes the per-read inflate calls.
+            buffered = io.BufferedReader(handle, buffer_size=1 << 20)
+            wrapper = io.TextIOWrapper(buffered, encoding="utf-8", errors="ignore")
             for line in wrapper:
                 yield line.rstrip("\r\n")
 
 
+# Canonical DP form: "DD:MM:SS N DDD:MM:SS E", optionally comma-separated.
+_DP_RE = re.compile(
+    r"(\d+):(\d+):(\d+(?:\.\d+)?)\s*([NS])[\s,]+(\d+):(\d+):(\d+(?:\.\d+)?)\s*([EW])"
+)
+
+
 def _parse_dp(value: str) -> Optional[tuple[float, float]]:
+    match = _DP_RE.match(value.strip())
+    if match:
+        lat_d, lat_m, lat_s, lat_h, lon_d, lon_m, lon_s, lon_h = match.groups()
+        lat = (int(lat_d) * 3600 + int(lat_m) * 60 + float(lat_s)) / 3600.0
+        lon = (int(lon_d) * 3600 + int(lon_m) * 60 + float(lon_s)) / 3600.0
+        return (-lon if lon_h == "W" else lon, -lat if lat_h == "S" else lat)
     tokens = value.replace(",", " ").split()
     if not tokens:
         return None
@@ -160,21 +177,27 @@ def _parse_dms(value: str, hemisphere: Optional[str]) -> Optional[float]:
         value = value[1:]
     parts = value.split(":")
     try:
-        degrees = float(parts[0])
-        minutes = float(parts[1]) if len(parts) > 1 else 0.0
-        seconds = float(parts[2]) if len(parts) > 2 else 0.0
-    except (ValueError, IndexError):
+        seconds = float(parts[0]) * 3600.0
+        if len(parts) > 1:
+            seconds += float(parts[1]) * 60.0
+        if len(parts) > 2:
+            seconds += float(parts[2])
+    except ValueError:
         return None
-    result = degrees + minutes / 60.0 + seconds / 3600.0
+    result = seconds / 3600.0
     if hemisphere in {"S", "W"}:
         result = -result
     return result
 
 
+_DECIMAL_RE = re.compile(r"\d+\.\d+")
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_name(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
     tokens = normalized.strip().upper().split()
-    while tokens and re.fullmatch(r"\d+\.\d+", tokens[-1]):
+    while tokens and _DECIMAL_RE.fullmatch(tokens[-1]):
         tokens.pop()
     return " ".join(tokens)
 
@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
+import mmap
+import os
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Iterable, Iterator, Optional
 
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover - stdlib fallback is exercised instead
+    _lxml_etree = None
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ParsedDataset:
     """Metadata for a parsed OFMX dataset."""
 
     source_path: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Airport:
     ofmx_id: str
     region: Optional[str]
@@ -36,7 +45,7 @@ class Airport:
     longitude: Optional[float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Runway:
     ofmx_id: str
     airport_ofmx_id: Optional[str]
@@ -52,7 +61,7 @@ class Runway:
     uom_dim_strip: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunwayEnd:
     ofmx_id: str
     runway_ofmx_id: Optional[str]
@@ -64,7 +73,7 @@ class RunwayEnd:
     longitude: Optional[float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Airspace:
     ofmx_id: str
     region: Optional[str]
@@ -82,7 +91,7 @@ class Airspace:
     remarks: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Navaid:
     ofmx_id: str
     region: Optional[str]
@@ -103,7 +112,7 @@ class Navaid:
     longitude: Optional[float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Waypoint:
     ofmx_id: str
     region: Optional[str]
@@ -114,10 +123,12 @@ class Waypoint:
     longitude: Optional[float]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AirspaceShape:
     ofmx_id: str
-    positions: list[tuple[float, float]]
+    #: Interleaved lon,lat doubles — a packed buffer instead of a list of
+    #: boxed tuples, since shapes run to thousands of vertices.
+    positions: array
 
 
 Record = Airport | Runway | RunwayEnd | Airspace | Navaid | Waypoint
@@ -133,8 +144,23 @@ def iter_ofmx_files(root: Path) -> Iterable[Path]:
     if not root.is_dir():
         return
 
-    for path in sorted(root.rglob("*.ofmx")):
-        yield path
+    yield from _scan_ofmx(str(root))
+
+
+def _scan_ofmx(directory: str) -> Iterator[Path]:
+    # os.scandir reuses the directory entry's type information, so no extra
+    # stat per entry, and matches stream out per directory instead of
+    # materializing the whole tree before the first yield.
+    try:
+        with os.scandir(directory) as entries:
+            ordered = sorted(entries, key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in ordered:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_ofmx(entry.path)
+        elif entry.name.endswith(".ofmx") and entry.is_file():
+            yield Path(entry.path)
 
 
 def parse_dataset(path: Path) -> ParsedDataset:
@@ -146,188 +172,295 @@ def parse_dataset(path: Path) -> ParsedDataset:
 def iter_airports(path: Path) -> Iterator[Airport]:
     """Yield airports (Ahp)."""
 
-    for _, elem in ET.iterparse(path, events=("end",)):
-        if elem.tag != "Ahp":
-            continue
-        ahp_uid = elem.find("AhpUid")
-        if ahp_uid is None:
-            elem.clear()
-            continue
-        yield Airport(
-            ofmx_id=ahp_uid.get("mid", ""),
-            region=ahp_uid.get("region"),
-            code_id=_text(ahp_uid, "codeId"),
-            code_icao=_text(elem, "codeIcao"),
-            code_gps=_text(elem, "codeGps"),
-            code_type=_text(elem, "codeType"),
-            name=_text(elem, "txtName"),
-            city=_text(elem, "txtNameCitySer"),
-            elevation=_to_int(_text(elem, "valElev")),
-            elevation_uom=_text(elem, "uomDistVer"),
-            mag_var=_to_float(_text(elem, "valMagVar")),
-            mag_var_year=_to_int(_text(elem, "dateMagVar")),
-            transition_alt=_to_int(_text(elem, "valTransitionAlt")),
-            transition_alt_uom=_text(elem, "uomTransitionAlt"),
-            remarks=_text(elem, "txtRmk"),
-            latitude=_parse_coordinate(_text(elem, "geoLat")),
-            longitude=_parse_coordinate(_text(elem, "geoLong")),
-        )
-        elem.clear()
+    yield from _iter_kind(path, "airport")
 
 
 def iter_runways(path: Path) -> Iterator[Runway]:
     """Yield runways (Rwy)."""
 
-    for _, elem in ET.iterparse(path, events=("end",)):
-        if elem.tag != "Rwy":
-            continue
-        rwy_uid = elem.find("RwyUid")
-        if rwy_uid is None:
-            elem.clear()
-            continue
-        ahp_uid = rwy_uid.find("AhpUid")
-        yield Runway(
-            ofmx_id=rwy_uid.get("mid", ""),
-            airport_ofmx_id=ahp_uid.get("mid") if ahp_uid is not None else None,
-            designator=_text(rwy_uid, "txtDesig"),
-            length=_to_int(_text(elem, "valLen")),
-            width=_to_int(_text(elem, "valWid")),
-            uom_dim_rwy=_text(elem, "uomDimRwy"),
-            surface=_text(elem, "codeComposition"),
-            preparation=_text(elem, "codePreparation"),
-            pcn_note=_text(elem, "txtPcnNote"),
-            strip_length=_to_int(_text(elem, "valLenStrip")),
-            strip_width=_to_int(_text(elem, "valWidStrip")),
-            uom_dim_strip=_text(elem, "uomDimStrip"),
-        )
-        elem.clear()
+    yield from _iter_kind(path, "runway")
 
 
 def iter_runway_ends(path: Path) -> Iterator[RunwayEnd]:
     """Yield runway ends (Rdn)."""
 
-    for _, elem in ET.iterparse(path, events=("end",)):
-        if elem.tag != "Rdn":
-            continue
-        rdn_uid = elem.find("RdnUid")
-        if rdn_uid is None:
-            elem.clear()
-            continue
-        rwy_uid = rdn_uid.find("RwyUid")
-        ahp_uid = rwy_uid.find("AhpUid") if rwy_uid is not None else None
-        yield RunwayEnd(
-            ofmx_id=rdn_uid.get("mid", ""),
-            runway_ofmx_id=rwy_uid.get("mid") if rwy_uid is not None else None,
-            airport_ofmx_id=ahp_uid.get("mid") if ahp_uid is not None else None,
-            designator=_text(rdn_uid, "txtDesig"),
-            true_bearing=_to_float(_text(elem, "valTrueBrg")),
-            mag_bearing=_to_float(_text(elem, "valMagBrg")),
-            latitude=_parse_coordinate(_text(elem, "geoLat")),
-            longitude=_parse_coordinate(_text(elem, "geoLong")),
-        )
-        elem.clear()
+    yield from _iter_kind(path, "runway_end")
 
 
 def iter_airspaces(path: Path) -> Iterator[Airspace]:
     """Yield airspaces (Ase)."""
 
-    for _, elem in ET.iterparse(path, events=("end",)):
-        if elem.tag != "Ase":
-            continue
-        ase_uid = elem.find("AseUid")
-        if ase_uid is None:
-            elem.clear()
-            continue
-        yield Airspace(
-            ofmx_id=ase_uid.get("mid", ""),
-            region=ase_uid.get("region"),
-            code_id=_text(ase_uid, "codeId"),
-            code_type=_text(ase_uid, "codeType"),
-            name=_text(elem, "txtName"),
-            name_alt=_text(elem, "txtNameAlt"),
-            airspace_class=_text(elem, "codeClass"),
-            upper_ref=_text(elem, "codeDistVerUpper"),
-            upper_value=_to_int(_text(elem, "valDistVerUpper")),
-            upper_uom=_text(elem, "uomDistVerUpper"),
-            lower_ref=_text(elem, "codeDistVerLower"),
-            lower_value=_to_int(_text(elem, "valDistVerLower")),
-            lower_uom=_text(elem, "uomDistVerLower"),
-            remarks=_text(elem, "txtRmk"),
-        )
-        elem.clear()
+    yield from _iter_kind(path, "airspace")
 
 
 def iter_waypoints(path: Path) -> Iterator[Waypoint]:
     """Yield designated points (Dpn)."""
 
-    for _, elem in ET.iterparse(path, events=("end",)):
-        if elem.tag != "Dpn":
-            continue
-        dpn_uid = elem.find("DpnUid")
-        if dpn_uid is None:
-            elem.clear()
-            continue
-        yield Waypoint(
-            ofmx_id=dpn_uid.get("mid", ""),
-            region=dpn_uid.get("region"),
-            code_id=_text(dpn_uid, "codeId"),
-            name=_text(elem, "txtName"),
-            point_type=_text(elem, "codeType"),
-            latitude=_parse_coordinate(_text(dpn_uid, "geoLat")),
-            longitude=_parse_coordinate(_text(dpn_uid, "geoLong")),
-        )
-        elem.clear()
+    yield from _iter_kind(path, "waypoint")
 
 
 def iter_navaids(path: Path) -> Iterator[Navaid]:
     """Yield NDB, VOR, and DME records."""
 
-    for _, elem in ET.iterparse(path, events=("end",)):
-        if elem.tag not in {"Ndb", "Vor", "Dme"}:
-            continue
-        uid_tag = f"{elem.tag}Uid"
-        navaid_uid = elem.find(uid_tag)
-        if navaid_uid is None:
-            elem.clear()
-            continue
-        vor_uid = elem.find("VorUid") if elem.tag == "Dme" else None
-        yield Navaid(
-            ofmx_id=navaid_uid.get("mid", ""),
-            region=navaid_uid.get("region"),
-            code_id=_text(navaid_uid, "codeId"),
-            name=_text(elem, "txtName"),
-            navaid_type=elem.tag.upper(),
-            code_type=_text(elem, "codeType"),
-            frequency=_to_float(_text(elem, "valFreq")),
-            frequency_uom=_text(elem, "uomFreq"),
-            channel=_text(elem, "codeChannel"),
-            ghost_frequency=_to_float(_text(elem, "valGhostFreq")),
-            elevation=_to_int(_text(elem, "valElev")),
-            elevation_uom=_text(elem, "uomDistVer"),
-            mag_var=_to_float(_text(elem, "valMagVar")),
-            datum=_text(elem, "codeDatum"),
-            associated_vor_ofmx_id=vor_uid.get("mid") if vor_uid is not None else None,
-            latitude=_parse_coordinate(_text(navaid_uid, "geoLat")),
-            longitude=_parse_coordinate(_text(navaid_uid, "geoLong")),
-        )
-        elem.clear()
+    yield from _iter_kind(path, "navaid")
+
+
+def iter_all(path: Path) -> Iterator[tuple[str, Record]]:
+    """Yield ``(kind, record)`` pairs for every entity in one iterparse pass.
+
+    Kinds are ``airport``, ``runway``, ``runway_end``, ``airspace``,
+    ``navaid``, and ``waypoint``.
+    """
+
+    for elem in _fast_iter(path, _RECORD_TAGS):
+        kind, build = _RECORD_BUILDERS[elem.tag]
+        record = build(elem)
+        if record is not None:
+            yield kind, record
+
+
+def _fast_iter(path: Path, tags: tuple[str, ...]) -> Iterator[ET.Element]:
+    """Yield matching elements from one iterparse pass, keeping memory flat.
+
+    iterparse leaves every finished element attached to its parent, so a
+    plain loop accumulates the whole tree as empty husks and memory grows
+    with record count. After the caller is done with an element we clear
+    it and detach the already-consumed siblings, so the resident set stays
+    constant regardless of file size. With lxml installed, libxml2 also
+    skips events for non-matching tags at the C level; the stdlib fallback
+    filters in Python and prunes via the root element instead.
+
+    The parser reads from an mmap of the file where possible, so the
+    kernel prefetches sequentially and the pages are served without
+    buffered-I/O copies.
+    """
+
+    with path.open("rb") as handle:
+        buffer = _map_readonly(handle)
+        source = buffer if buffer is not None else handle
+        try:
+            if _lxml_etree is not None:
+                for _, elem in _lxml_etree.iterparse(source, events=("end",), tag=tags):
+                    yield elem
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                return
+            wanted = frozenset(tags)
+            root: Optional[ET.Element] = None
+            for event, elem in ET.iterparse(source, events=("start", "end")):
+                if root is None:
+                    root = elem
+                    continue
+                if event == "end" and elem.tag in wanted:
+                    yield elem
+                    # Record tags never nest, so every sibling under the
+                    # root is a finished record by now and can be dropped
+                    # wholesale.
+                    root.clear()
+        finally:
+            if buffer is not None:
+                buffer.close()
+
+
+def _map_readonly(handle) -> Optional[mmap.mmap]:
+    try:
+        buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # Empty or unmappable files fall back to plain reads.
+        return None
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        buffer.madvise(mmap.MADV_SEQUENTIAL)
+    return buffer
+
+
+def _iter_kind(path: Path, target_kind: str) -> Iterator[Record]:
+    # Parse with only the target kind's tags so the other record types are
+    # never built (and, under lxml, never surface as events at all).
+    for elem in _fast_iter(path, _KIND_TAGS[target_kind]):
+        record = _RECORD_BUILDERS[elem.tag][1](elem)
+        if record is not None:
+            yield record
+
+
+def _airport_record(elem: ET.Element) -> Optional[Airport]:
+    ahp_uid = elem.find("AhpUid")
+    if ahp_uid is None:
+        return None
+    fields = _child_text_map(elem)
+    return Airport(
+        ofmx_id=ahp_uid.get("mid", ""),
+        region=_intern_opt(ahp_uid.get("region")),
+        code_id=_child_text_map(ahp_uid).get("codeId"),
+        code_icao=fields.get("codeIcao"),
+        code_gps=fields.get("codeGps"),
+        code_type=_intern_opt(fields.get("codeType")),
+        name=fields.get("txtName"),
+        city=fields.get("txtNameCitySer"),
+        elevation=_to_int(fields.get("valElev")),
+        elevation_uom=_intern_opt(fields.get("uomDistVer")),
+        mag_var=_to_float(fields.get("valMagVar")),
+        mag_var_year=_to_int(fields.get("dateMagVar")),
+        transition_alt=_to_int(fields.get("valTransitionAlt")),
+        transition_alt_uom=_intern_opt(fields.get("uomTransitionAlt")),
+        remarks=fields.get("txtRmk"),
+        latitude=_parse_coordinate(fields.get("geoLat")),
+        longitude=_parse_coordinate(fields.get("geoLong")),
+    )
+
+
+def _runway_record(elem: ET.Element) -> Optional[Runway]:
+    rwy_uid = elem.find("RwyUid")
+    if rwy_uid is None:
+        return None
+    ahp_uid = rwy_uid.find("AhpUid")
+    fields = _child_text_map(elem)
+    return Runway(
+        ofmx_id=rwy_uid.get("mid", ""),
+        airport_ofmx_id=ahp_uid.get("mid") if ahp_uid is not None else None,
+        designator=_child_text_map(rwy_uid).get("txtDesig"),
+        length=_to_int(fields.get("valLen")),
+        width=_to_int(fields.get("valWid")),
+        uom_dim_rwy=_intern_opt(fields.get("uomDimRwy")),
+        surface=_intern_opt(fields.get("codeComposition")),
+        preparation=_intern_opt(fields.get("codePreparation")),
+        pcn_note=fields.get("txtPcnNote"),
+        strip_length=_to_int(fields.get("valLenStrip")),
+        strip_width=_to_int(fields.get("valWidStrip")),
+        uom_dim_strip=_intern_opt(fields.get("uomDimStrip")),
+    )
+
+
+def _runway_end_record(elem: ET.Element) -> Optional[RunwayEnd]:
+    rdn_uid = elem.find("RdnUid")
+    if rdn_uid is None:
+        return None
+    rwy_uid = rdn_uid.find("RwyUid")
+    ahp_uid = rwy_uid.find("AhpUid") if rwy_uid is not None else None
+    fields = _child_text_map(elem)
+    return RunwayEnd(
+        ofmx_id=rdn_uid.get("mid", ""),
+        runway_ofmx_id=rwy_uid.get("mid") if rwy_uid is not None else None,
+        airport_ofmx_id=ahp_uid.get("mid") if ahp_uid is not None else None,
+        designator=_child_text_map(rdn_uid).get("txtDesig"),
+        true_bearing=_to_float(fields.get("valTrueBrg")),
+        mag_bearing=_to_float(fields.get("valMagBrg")),
+        latitude=_parse_coordinate(fields.get("geoLat")),
+        longitude=_parse_coordinate(fields.get("geoLong")),
+    )
+
+
+def _airspace_record(elem: ET.Element) -> Optional[Airspace]:
+    ase_uid = elem.find("AseUid")
+    if ase_uid is None:
+        return None
+    fields = _child_text_map(elem)
+    uid_fields = _child_text_map(ase_uid)
+    return Airspace(
+        ofmx_id=ase_uid.get("mid", ""),
+        region=_intern_opt(ase_uid.get("region")),
+        code_id=uid_fields.get("codeId"),
+        code_type=_intern_opt(uid_fields.get("codeType")),
+        name=fields.get("txtName"),
+        name_alt=fields.get("txtNameAlt"),
+        airspace_class=_intern_opt(fields.get("codeClass")),
+        upper_ref=_intern_opt(fields.get("codeDistVerUpper")),
+        upper_value=_to_int(fields.get("valDistVerUpper")),
+        upper_uom=_intern_opt(fields.get("uomDistVerUpper")),
+        lower_ref=_intern_opt(fields.get("codeDistVerLower")),
+        lower_value=_to_int(fields.get("valDistVerLower")),
+        lower_uom=_intern_opt(fields.get("uomDistVerLower")),
+        remarks=fields.get("txtRmk"),
+    )
+
+
+def _waypoint_record(elem: ET.Element) -> Optional[Waypoint]:
+    dpn_uid = elem.find("DpnUid")
+    if dpn_uid is None:
+        return None
+    fields = _child_text_map(elem)
+    uid_fields = _child_text_map(dpn_uid)
+    return Waypoint(
+        ofmx_id=dpn_uid.get("mid", ""),
+        region=_intern_opt(dpn_uid.get("region")),
+        code_id=uid_fields.get("codeId"),
+        name=fields.get("txtName"),
+        point_type=_intern_opt(fields.get("codeType")),
+        latitude=_parse_coordinate(uid_fields.get("geoLat")),
+        longitude=_parse_coordinate(uid_fields.get("geoLong")),
+    )
+
+
+# Per-tag constants so the hot loop never rebuilds the Uid tag string or
+# uppercases the type per record.
+_NAVAID_TAGS = {
+    "Ndb": ("NdbUid", "NDB"),
+    "Vor": ("VorUid", "VOR"),
+    "Dme": ("DmeUid", "DME"),
+}
+
+
+def _navaid_record(elem: ET.Element) -> Optional[Navaid]:
+    uid_tag, navaid_type = _NAVAID_TAGS[elem.tag]
+    navaid_uid = elem.find(uid_tag)
+    if navaid_uid is None:
+        return None
+    vor_uid = elem.find("VorUid") if elem.tag == "Dme" else None
+    fields = _child_text_map(elem)
+    uid_fields = _child_text_map(navaid_uid)
+    return Navaid(
+        ofmx_id=navaid_uid.get("mid", ""),
+        region=_intern_opt(navaid_uid.get("region")),
+        code_id=uid_fields.get("codeId"),
+        name=fields.get("txtName"),
+        navaid_type=navaid_type,
+        code_type=_intern_opt(fields.get("codeType")),
+        frequency=_to_float(fields.get("valFreq")),
+        frequency_uom=_intern_opt(fields.get("uomFreq")),
+        channel=fields.get("codeChannel"),
+        ghost_frequency=_to_float(fields.get("valGhostFreq")),
+        elevation=_to_int(fields.get("valElev")),
+        elevation_uom=_intern_opt(fields.get("uomDistVer")),
+        mag_var=_to_float(fields.get("valMagVar")),
+        datum=_intern_opt(fields.get("codeDatum")),
+        associated_vor_ofmx_id=vor_uid.get("mid") if vor_uid is not None else None,
+        latitude=_parse_coordinate(uid_fields.get("geoLat")),
+        longitude=_parse_coordinate(uid_fields.get("geoLong")),
+    )
+
+
+_RECORD_BUILDERS = {
+    "Ahp": ("airport", _airport_record),
+    "Rwy": ("runway", _runway_record),
+    "Rdn": ("runway_end", _runway_end_record),
+    "Ase": ("airspace", _airspace_record),
+    "Ndb": ("navaid", _navaid_record),
+    "Vor": ("navaid", _navaid_record),
+    "Dme": ("navaid", _navaid_record),
+    "Dpn": ("waypoint", _waypoint_record),
+}
+
+_RECORD_TAGS = tuple(_RECORD_BUILDERS)
+
+# Each kind's own tags, for the single-kind iterators ("navaid" spans Ndb,
+# Vor, and Dme).
+_KIND_TAGS: dict[str, tuple[str, ...]] = {}
+for _tag, (_kind, _) in _RECORD_BUILDERS.items():
+    _KIND_TAGS[_kind] = _KIND_TAGS.get(_kind, ()) + (_tag,)
+del _tag, _kind
 
 
 def iter_airspace_shapes(path: Path) -> Iterator[AirspaceShape]:
     """Yield airspace shapes from the OFM shape extension file."""
 
-    for _, elem in ET.iterparse(path, events=("end",)):
-        if elem.tag != "Ase":
-            continue
+    for elem in _fast_iter(path, ("Ase",)):
         ase_uid = elem.find("AseUid")
         if ase_uid is None:
-            elem.clear()
             continue
         gml = _text(elem, "gmlPosList")
         positions = _parse_gml_pos_list(gml)
         if positions:
             yield AirspaceShape(ofmx_id=ase_uid.get("mid", ""), positions=positions)
-        elem.clear()
 
 
 def _text(elem: ET.Element, tag: str) -> Optional[str]:
@@ -337,9 +470,32 @@ def _text(elem: ET.Element, tag: str) -> Optional[str]:
     return child.text.strip()
 
 
+def _child_text_map(elem: ET.Element) -> dict[str, str]:
+    """Map child tags to their stripped text in a single pass.
+
+    Record builders read a dozen-plus fields per element; each `find`
+    rescans the children, so looking everything up through one dict walk
+    keeps extraction linear in the child count.
+    """
+
+    return {child.tag: child.text.strip() for child in elem if child.text is not None}
+
+
+def _intern_opt(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return sys.intern(value)
+
+
 def _to_int(value: Optional[str]) -> Optional[int]:
     if value is None:
         return None
+    # Most OFMX numeric fields are plain integers; parse those directly
+    # and only fall back to the truncating float round-trip for decimals.
+    try:
+        return int(value)
+    except ValueError:
+        pass
     try:
         return int(float(value))
     except ValueError:
@@ -356,24 +512,44 @@ def _to_float(value: Optional[str]) -> Optional[float]:
 
 
 def _parse_coordinate(value: Optional[str]) -> Optional[float]:
+    # Inputs arrive pre-stripped from _child_text_map, so the last
+    # character decides the hemisphere directly; anything else trailing
+    # fails the float parse below.
     if not value:
         return None
-    raw = value.strip()
-    hemisphere = raw[-1].upper() if raw[-1].isalpha() else ""
-    number = raw[:-1] if hemisphere else raw
+    last = value[-1]
+    if last in "NSEWnsew":
+        try:
+            parsed = float(value[:-1])
+        except ValueError:
+            return None
+        return -parsed if last in "SWsw" else parsed
     try:
-        parsed = float(number)
+        return float(value)
     except ValueError:
         return None
-    if hemisphere in {"S", "W"}:
-        return -parsed
-    return parsed
 
 
-def _parse_gml_pos_list(value: Optional[str]) -> list[tuple[float, float]]:
+def _parse_gml_pos_list(value: Optional[str]) -> array:
     if not value:
-        return []
-    points: list[tuple[float, float]] = []
+        return array("d")
+    # Fast path: for well-formed "lon,lat lon,lat ..." lists one replace,
+    # one split, and a C-level map(float) fill the packed buffer without a
+    # Python-level loop. Shape polygons run to thousands of vertices, so
+    # this dominates shape-extension ingest.
+    try:
+        coords = array("d", map(float, value.replace(",", " ").split()))
+    except ValueError:
+        return _parse_gml_pos_list_tolerant(value)
+    # One comma per pair guards the pairing: extra components or stray
+    # tokens fall back to the per-token parse.
+    if len(coords) != 2 * value.count(","):
+        return _parse_gml_pos_list_tolerant(value)
+    return coords
+
+
+def _parse_gml_pos_list_tolerant(value: str) -> array:
+    coords = array("d")
     for token in value.split():
         parts = token.split(",")
         if len(parts) < 2:
@@ -383,5 +559,6 @@ def _parse_gml_pos_list(value: Optional[str]) -> list[tuple[float, float]]:
             lat = float(parts[1])
         except ValueError:
             continue
-        points.append((lon, lat))
-    return points
+        coords.append(lon)
+        coords.append(lat)
+    return coords
@@ -0,0 +1,94 @@
+from array import array
+from pathlib import Path
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from ofmx2pgsql import db
+
+# Hex EWKB for POINT(12.24 50.06), SRID 4326, little-endian.
+POINT_EWKB = "0101000020e61000007b14ae47e17a284048e17a14ae074940"
+# LINESTRING(12.0 50.0, 12.5 50.5).
+LINE_EWKB = (
+    "0102000020e610000002000000"
+    "00000000000028400000000000004940"
+    "00000000000029400000000000404940"
+)
+# MULTIPOLYGON(((12.0 50.0, 12.5 50.5, 12.5 50.0, 12.0 50.0))).
+MULTIPOLYGON_EWKB = (
+    "0106000020e610000001000000"
+    "010300000001000000"
+    "04000000"
+    "00000000000028400000000000004940"
+    "00000000000029400000000000404940"
+    "00000000000029400000000000004940"
+    "00000000000028400000000000004940"
+)
+
+
+class GeometryEncodingTests(unittest.TestCase):
+    def test_point_ewkb(self) -> None:
+        self.assertEqual(db._point_ewkb(12.24, 50.06), POINT_EWKB)
+
+    def test_line_ewkb(self) -> None:
+        self.assertEqual(db._line_ewkb(12.0, 50.0, 12.5, 50.5), LINE_EWKB)
+
+    def test_multipolygon_ewkb_closes_open_ring(self) -> None:
+        open_ring = array("d", [12.0, 50.0, 12.5, 50.5, 12.5, 50.0])
+        self.assertEqual(db._multipolygon_ewkb(open_ring), MULTIPOLYGON_EWKB)
+        # The shared input buffer must not be mutated by the closing copy.
+        self.assertEqual(list(open_ring), [12.0, 50.0, 12.5, 50.5, 12.5, 50.0])
+
+    def test_multipolygon_ewkb_keeps_closed_ring(self) -> None:
+        closed_ring = array(
+            "d", [12.0, 50.0, 12.5, 50.5, 12.5, 50.0, 12.0, 50.0]
+        )
+        self.assertEqual(db._multipolygon_ewkb(closed_ring), MULTIPOLYGON_EWKB)
+
+    def test_multipolygon_ewkb_rejects_degenerate_rings(self) -> None:
+        self.assertIsNone(db._multipolygon_ewkb(array("d", [12.0, 50.0, 12.5, 50.5])))
+        self.assertIsNone(db._multipolygon_ewkb(array("d")))
+
+
+class UpsertSqlTests(unittest.TestCase):
+    def test_upsert_sql_statements(self) -> None:
+        create, add_seq, copy_sql, probe, insert, merge = db._upsert_sql(
+            "ofmx", "waypoints", ("ofmx_id", "code_id", "geom"), ("ofmx_id",)
+        )
+        self.assertEqual(
+            create,
+            "CREATE TEMP TABLE _stage_waypoints (LIKE ofmx.waypoints) ON COMMIT DROP",
+        )
+        self.assertEqual(
+            add_seq, "ALTER TABLE _stage_waypoints ADD COLUMN _seq BIGSERIAL"
+        )
+        self.assertEqual(
+            copy_sql, "COPY _stage_waypoints (ofmx_id, code_id, geom) FROM STDIN"
+        )
+        self.assertEqual(probe, "SELECT 1 FROM ofmx.waypoints LIMIT 1")
+        self.assertEqual(
+            insert,
+            "INSERT INTO ofmx.waypoints (ofmx_id, code_id, geom) "
+            "SELECT DISTINCT ON (ofmx_id) ofmx_id, code_id, geom "
+            "FROM _stage_waypoints ORDER BY ofmx_id, _seq DESC",
+        )
+        self.assertEqual(
+            merge,
+            insert
+            + " ON CONFLICT (ofmx_id) DO UPDATE SET"
+            + " code_id = EXCLUDED.code_id, geom = EXCLUDED.geom",
+        )
+
+    def test_upsert_sql_composite_conflict(self) -> None:
+        _, _, _, _, insert, merge = db._upsert_sql(
+            "ofmx", "airspaces", ("ofmx_id", "region", "name"), ("ofmx_id", "region")
+        )
+        self.assertIn("DISTINCT ON (ofmx_id, region)", insert)
+        self.assertIn("ORDER BY ofmx_id, region, _seq DESC", insert)
+        self.assertIn("ON CONFLICT (ofmx_id, region)", merge)
+        self.assertNotIn("region = EXCLUDED.region", merge)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -42,7 +42,8 @@ class ParserTests(unittest.TestCase):
         shapes = parser.iter_airspace_shapes(SHAPES_FILE)
         first = next(shapes)
         self.assertIsNotNone(first.ofmx_id)
-        self.assertGreater(len(first.positions), 3)
+        # positions holds interleaved lon,lat doubles: two per vertex.
+        self.assertGreater(len(first.positions) // 2, 3)
 
 
 if __name__ == "__main__":